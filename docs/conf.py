@@ -19,6 +19,7 @@ import glob
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import guzzle_sphinx_theme
 from setuptools_scm import get_version
@@ -100,9 +101,10 @@ html_theme = "guzzle_sphinx_theme"
 html_static_path = ["_static"]
 
 
-def do_edits():
-
-    pats = [
+# Post sphinx text substitutions, applied to the built html files
+_EDIT_PATTERNS = [
+    (re.compile(pattern), replacement)
+    for pattern, replacement in [
         # Hacks to shorten type descriptors
         (r"quantumflow\.qubits", r"qf"),
         (r"quantumflow\.ops", r"qf"),
@@ -126,17 +128,37 @@ def do_edits():
         ("Sequence[qf.Qubit]", "qf.Qubits"),
         ("Sequence[Union[float, sympy.core.expr.Expr]]", "qf.Variable"),
     ]
+]
+
 
-    files = glob.glob("*build/html/*.html")
-    for filename in files:
-        with open(filename, "r+") as f:
-            text = f.read()
-            for pattern, replacement in pats:
-                text = re.sub(pattern, replacement, text)
-            f.seek(0)
-            f.truncate()
+def _edit_file(filename):
+    with open(filename, "r") as f:
+        original = f.read()
+    text = original
+    for pattern, replacement in _EDIT_PATTERNS:
+        text = pattern.sub(replacement, text)
+    if text != original:
+        with open(filename, "w") as f:
             f.write(text)
 
+
+def do_edits():
+    for htmldir in glob.glob("*build/html"):
+        # Files not rebuilt since the last run have already been edited.
+        stamp = os.path.join(os.path.dirname(htmldir), ".qf_edits")
+        last_edit = os.stat(stamp).st_mtime if os.path.exists(stamp) else 0.0
+
+        files = [
+            filename
+            for filename in glob.glob(os.path.join(htmldir, "*.html"))
+            if os.stat(filename).st_mtime > last_edit
+        ]
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(_edit_file, files))
+
+        with open(stamp, "w"):
+            pass
+
     print("Note: post sphinx text substitutions performed (conf.py)")
 
 
@@ -60,6 +60,7 @@ import numpy as np
 from scipy import linalg
 
 from . import tensors, utils
+from .config import ATOL, RTOL
 from .ops import Channel, Gate, Operation, UnitaryGate
 from .qubits import Qubit, Qubits, sorted_qubits
 from .states import Density, State
@@ -250,14 +251,14 @@ def channel_to_kraus(chan: Channel) -> "Kraus":
     evals, evecs = np.linalg.eig(choi)
     evecs = np.transpose(evecs)
 
-    assert np.allclose(evals.imag, 0.0)  # FIXME exception
+    assert np.allclose(evals.imag, 0.0, atol=ATOL)  # FIXME exception
     assert np.all(evals.real >= 0.0)  # FIXME exception
 
     values = np.sqrt(evals.real)
 
     ops = []
     for i in range(2 ** (2 * N)):
-        if not np.isclose(values[i], 0.0):
+        if not np.isclose(values[i], 0.0, atol=ATOL):
             mat = np.reshape(evecs[i], (2 ** N, 2 ** N)) * values[i]
             g = UnitaryGate(mat, qubits)
             ops.append(g)
@@ -281,7 +282,7 @@ def kraus_iscomplete(kraus: Kraus) -> bool:
     res = UnitaryGate(tensor, qubits)
 
     N = res.qubit_nb
-    return np.allclose(res.asoperator(), np.eye(2 ** N))
+    return np.allclose(res.asoperator(), np.eye(2 ** N), rtol=RTOL, atol=ATOL)
 
 
 # TODO: as class RandomChannel?
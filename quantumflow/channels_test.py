@@ -15,6 +15,7 @@ import numpy as np
 import pytest
 
 import quantumflow as qf
+from quantumflow.config import ATOL
 
 
 def test_transpose_map() -> None:
@@ -63,9 +64,9 @@ def test_state_to_density() -> None:
     assert list(density.tensor.shape) == [2] * 8
 
     prob = density.probabilities()
-    assert np.isclose(prob[0, 0, 0, 0] - 0.5, 0.0)
-    assert np.isclose(prob[0, 1, 0, 0], 0.0)
-    assert np.isclose(prob[1, 1, 1, 1] - 0.5, 0.0)
+    assert np.isclose(prob[0, 0, 0, 0] - 0.5, 0.0, atol=ATOL)
+    assert np.isclose(prob[0, 1, 0, 0], 0.0, atol=ATOL)
+    assert np.isclose(prob[1, 1, 1, 1] - 0.5, 0.0, atol=ATOL)
 
     ket = qf.random_state(3)
     density = ket.asdensity()
@@ -73,7 +74,7 @@ def test_state_to_density() -> None:
     density_prob = density.probabilities()
 
     for index, prob in np.ndenumerate(ket_prob):
-        assert np.isclose(prob - density_prob[index], 0.0)
+        assert np.isclose(prob - density_prob[index], 0.0, atol=ATOL)
 
 
 def test_purity() -> None:
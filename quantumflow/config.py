@@ -12,6 +12,9 @@ import re
 import sys
 import typing
 
+import numpy as np
+
+from . import tensors
 from .utils import importlib_metadata
 
 __all__ = ["__version__", "about"]
@@ -27,11 +30,15 @@ except Exception:  # pragma: no cover
 
 
 # See https://numpy.org/doc/stable/reference/generated/numpy.allclose.html
+# Tolerances are scaled up for single precision (See tensors.qubit_dtype), since
+# round off errors are then ~1e-7.
+
+_EPS = float(np.finfo(tensors.qubit_dtype).eps)
 
-RTOL = 1e-05
+RTOL = max(1e-05, 100 * _EPS)
 """Default relative tolerance for numerical comparisons"""
 
-ATOL = 1e-07
+ATOL = max(1e-07, 1000 * _EPS)
 """Default absolute tolerance for numerical comparisons"""
 
 
@@ -36,11 +36,9 @@ def test_copyright() -> None:
         print("Checking " + fname + " for copyright header...  ", end="")
 
         with open(fname, encoding="utf-8") as f:
-            for line in f.readlines():
-                if not line.strip():
-                    continue
-                assert line.startswith("# Copyright")
-                break
+            # Only read up to the first non-blank line
+            line = next((line for line in f if line.strip()), "")
+        assert line.startswith("# Copyright"), fname
         print("passed")
 
 
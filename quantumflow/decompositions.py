@@ -57,6 +57,18 @@ __all__ = [
 ]
 
 
+def _operator(gate: Gate) -> np.ndarray:
+    # Decompositions rely on eigen and singular value decompositions, and sanity
+    # check their results to double precision. So for single precision gates
+    # (See tensors.qubit_dtype) we upcast, and restore unitarity (lost to
+    # round off) by projecting onto the nearest unitary matrix.
+    U = gate.asoperator()
+    if U.dtype == np.complex128:
+        return U
+    W, _, Vh = np.linalg.svd(U.astype(np.complex128))
+    return W @ Vh
+
+
 # TODO: Optionally include phase
 def bloch_decomposition(gate: Gate) -> Circuit:
     """
@@ -69,8 +81,8 @@ def bloch_decomposition(gate: Gate) -> Circuit:
     if gate.qubit_nb != 1:
         raise ValueError("Expected 1-qubit gate")
 
-    U = gate.asoperator()
-    U /= np.linalg.det(U) ** (1 / 2)
+    U = _operator(gate)
+    U = U / np.linalg.det(U) ** (1 / 2)
 
     nx = -U[0, 1].imag
     ny = -U[0, 1].real
@@ -101,7 +113,7 @@ def zyz_decomposition(gate: Gate) -> Circuit:
 
     (q,) = gate.qubits
 
-    U = gate.su().asoperator()  # SU(2)
+    U = _operator(gate.su())  # SU(2)
 
     if abs(U[0, 0]) > abs(U[1, 0]):
         theta1 = 2 * np.arccos(min(abs(U[0, 0]), 1))
@@ -181,9 +193,9 @@ def kronecker_decomposition(gate: Gate, euler: str = "ZYZ") -> Circuit:
     if gate.qubit_nb != 2:
         raise ValueError("Expected 2-qubit gate")
 
-    U = gate.asoperator()
+    U = _operator(gate)
     rank = 2 ** gate.qubit_nb
-    U /= np.linalg.det(U) ** (1 / rank)
+    U = U / np.linalg.det(U) ** (1 / rank)
 
     R = U.reshape(2, 2, 2, 2)
     R = R.transpose(0, 2, 1, 3)
@@ -259,10 +271,10 @@ def canonical_decomposition(gate: Gate, euler: str = "ZYZ") -> Circuit:
     q0, q1 = gate.qubits
 
     assert almost_unitary(gate)  # Sanity check
-    U = gate.asoperator()
+    U = _operator(gate)
 
     rank = 2 ** gate.qubit_nb
-    U /= np.linalg.det(U) ** (1 / rank)  # U is in SU(4) so det U = 1
+    U = U / np.linalg.det(U) ** (1 / rank)  # U is in SU(4) so det U = 1
 
     U_mb = Q_H @ U @ Q  # Transform gate to Magic Basis [1, (eq. 17, 18)]
     M = U_mb.transpose() @ U_mb  # Construct M matrix [1, (eq. 22)]
@@ -725,7 +737,7 @@ def quantum_shannon_decomposition(gate: Gate, euler: str = "ZYZ") -> Circuit:
 
         assert almost_unitary(gate)  # Sanity check
 
-        U = gate.su().asoperator()
+        U = _operator(gate.su())
         R = 2 ** (N - 1)
 
         # cosine-sine decomposition
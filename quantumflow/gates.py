@@ -81,6 +81,7 @@ import scipy
 
 from . import tensors, utils, var
 from .circuits import Circuit
+from .config import ATOL, RTOL
 from .ops import Channel, Gate, Operation, UnitaryGate
 from .paulialgebra import Pauli, sX, sY, sZ
 from .qubits import Qubit, Qubits
@@ -589,7 +590,10 @@ class DiagonalGate(Gate):
             if gate.cv_tensor_structure == "identity":
                 return True
             return np.allclose(
-                np.diag(gate.tensor_diagonal.flatten()), gate.asoperator()
+                np.diag(gate.tensor_diagonal.flatten()),
+                gate.asoperator(),
+                rtol=RTOL,
+                atol=ATOL,
             )
 
         if not is_diagonal_gate(gate):
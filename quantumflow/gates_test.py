@@ -11,6 +11,7 @@ import scipy.linalg
 from sympy import Symbol
 
 import quantumflow as qf
+from quantumflow.translate.translate_gates import _pauli_term_circuits
 
 from .config_test import REPS
 
@@ -22,6 +23,10 @@ def test_IdentityGate() -> None:
     ket1 = gate.run(ket0)
     assert qf.states_close(ket0, ket1)
 
+    rho0 = qf.random_density(qubits)
+    rho1 = gate.evolve(rho0)
+    assert qf.densities_close(rho0, rho1)
+
     circ = qf.Circuit(gate.decompose())
     print(circ)
     assert len(circ) == 6
@@ -189,6 +194,29 @@ def test_PauliGate_more() -> None:
         qf.Circuit(qf.PauliGate(pauli, 0.2).decompose())
 
 
+def test_PauliGate_topology_changed() -> None:
+    gate = qf.PauliGate(qf.sZ(0) * qf.sZ(3), 0.3)
+    ket = qf.random_state([0, 1, 2, 3])
+
+    topology = nx.Graph()
+    nx.add_path(topology, [0, 1, 2, 3])
+    circ0 = qf.Circuit(gate.decompose(topology))
+    assert qf.states_close(gate.run(ket), circ0.run(ket))
+
+    # Decompositions are cached, but must follow changes to the topology
+    topology.remove_edge(1, 2)
+    topology.add_edge(0, 3)
+    circ1 = qf.Circuit(gate.decompose(topology))
+    assert qf.states_close(gate.run(ket), circ1.run(ket))
+    assert circ1.qubits == (0, 3)
+
+    # Equal topologies share cached decompositions
+    hits = _pauli_term_circuits.cache_info().hits
+    circ2 = qf.Circuit(gate.decompose(topology.copy()))
+    assert _pauli_term_circuits.cache_info().hits == hits + 1
+    assert qf.states_close(circ1.run(ket), circ2.run(ket))
+
+
 def test_PauliGate_resolve() -> None:
     alpha = qf.var.Symbol("alpha")
     g = qf.PauliGate(qf.sZ(0), alpha)
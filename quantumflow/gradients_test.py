@@ -8,6 +8,7 @@ import numpy as np
 import pytest
 
 import quantumflow as qf
+from quantumflow.config import ATOL, RTOL
 
 
 def test_gradients() -> None:
@@ -36,7 +37,7 @@ def test_gradients() -> None:
     # Check that qf.expectation_gradients() gives same answers for
     # fidelity as f.state_fidelity_gradients()
     for g0, g1 in zip(grads0, grads2):
-        assert np.isclose(g0, g1)
+        assert np.isclose(g0, g1, rtol=RTOL, atol=ATOL)
         print(g0, g1)
 
 
@@ -62,7 +63,7 @@ def test_gradients_func() -> None:
     # print(grads3)
 
     for g0, g1 in zip(grads1, grads3):
-        assert np.isclose(g0, g1)
+        assert np.isclose(g0, g1, rtol=RTOL, atol=ATOL)
         print(g0, g1)
 
 
@@ -66,13 +66,12 @@ Channel Measures
 """
 
 import numpy as np
-import scipy.stats
 from scipy.linalg import sqrtm  # matrix square root
 
 from . import tensors
 from .channels import Kraus
 from .circuits import Circuit
-from .config import ATOL
+from .config import ATOL, RTOL
 from .gates import IdentityGate
 from .ops import Channel, Gate
 from .qubits import Qubits
@@ -135,6 +134,10 @@ def fubini_study_fidelity(vec0: QubitTensor, vec1: QubitTensor) -> float:
     """
     # Suffers from less floating point errors compared to fubini_study_angle
 
+    # Upcast, since the angle is ill-conditioned when the fidelity is close to 1
+    vec0 = np.asarray(vec0, dtype=np.complex128)
+    vec1 = np.asarray(vec1, dtype=np.complex128)
+
     hs01 = tensors.inner(vec0, vec1)  # Hilbert-Schmidt inner product
     hs00 = tensors.inner(vec0, vec0)
     hs11 = tensors.inner(vec1, vec1)
@@ -260,6 +263,10 @@ def entropy(rho: Density, base: float = None) -> float:
     op = rho.asoperator()
     probs = np.linalg.eigvalsh(op)
     probs = np.maximum(probs, 0.0)  # Compensate for floating point errors
+
+    # Imported here since scipy.stats is slow to import
+    import scipy.stats
+
     return scipy.stats.entropy(probs, base=base)
 
 
@@ -433,7 +440,7 @@ def almost_unital(chan: Channel) -> bool:
     rho0 = Density(eye0, chan.qubits)
     rho1 = chan.evolve(rho0)
     eye1 = rho1.asoperator()
-    return np.allclose(eye0, eye1)
+    return np.allclose(eye0, eye1, rtol=RTOL, atol=ATOL)
 
 
 # fin
@@ -403,7 +403,8 @@ class Gate(Operation):
         # See test_gate_hamiltonians()
         from .paulialgebra import pauli_decompose_hermitian
 
-        H = -logm(self.asoperator()) / 1.0j
+        # Upcast, since logm is inaccurate in single precision
+        H = -logm(self.asoperator().astype(np.complex128)) / 1.0j
         pauli = pauli_decompose_hermitian(H, self.qubits)
         return pauli
 
@@ -439,7 +440,10 @@ class Gate(Operation):
 
     def asoperator(self) -> QubitTensor:
         """Return tensor with with qubit indices flattened"""
-        return tensors.flatten(self.tensor, rank=2)
+        operator = tensors.flatten(self.tensor, rank=2)
+        if not operator.flags.writeable:  # e.g. the shared tensors of StdGates
+            operator = operator.copy()
+        return operator
 
     @property
     @abstractmethod
@@ -458,7 +462,7 @@ class Gate(Operation):
         """Convert gate tensor to the special unitary group."""
         rank = 2 ** self.qubit_nb
         U = self.asoperator()
-        U /= np.linalg.det(U) ** (1 / rank)
+        U = U / np.linalg.det(U) ** (1 / rank)
         return UnitaryGate(U, self.qubits)
 
     @property
@@ -484,12 +488,13 @@ class Gate(Operation):
 
     def run(self, ket: State) -> State:
         """Apply the action of this gate upon a state"""
+        if self.cv_tensor_structure == "identity":
+            return ket
+
         qubits = self.qubits
         indices = ket.qubit_indices(qubits)
 
-        if self.cv_tensor_structure == "identity":
-            return ket
-        elif self.cv_tensor_structure == "diagonal":
+        if self.cv_tensor_structure == "diagonal":
             tensor = tensors.tensormul_diagonal(
                 self.tensor_diagonal, ket.tensor, tuple(indices)
             )
@@ -504,6 +509,9 @@ class Gate(Operation):
 
     def evolve(self, rho: Density) -> Density:
         """Apply the action of this gate upon a density"""
+        if self.cv_tensor_structure == "identity":
+            return rho
+
         # TODO: implement without explicit channel creation? With Kraus?
         chan = self.aschannel()
         return chan.evolve(rho)
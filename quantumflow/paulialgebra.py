@@ -31,20 +31,21 @@ QuantumFlow module for working with the Pauli algebra.
 
 import heapq
 from cmath import isclose  # type: ignore
-from functools import reduce
+from functools import lru_cache
 from itertools import groupby, product
 from numbers import Complex
-from operator import itemgetter, mul
-from typing import Any, Dict, Iterator, List, Set, Tuple, cast
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Sequence, Set, Tuple, cast
 
 import numpy as np
 
 from . import var
-from .config import ATOL
+from .config import ATOL, RTOL
 from .ops import Operation
 from .qubits import Qubit, Qubits
 from .states import State
 from .tensors import QubitTensor
+from .utils import cached_property
 from .var import Variable
 
 __all__ = [
@@ -66,6 +67,9 @@ __all__ = [
 
 PauliTerm = Tuple[Qubits, str, Variable]
 
+# Terms as stored by Pauli: sorted qubits, and no identity operators
+_CanonicalPauliTerm = Tuple[Tuple[Qubit, ...], str, Variable]
+
 PAULI_OPS = ["X", "Y", "Z", "I"]
 
 PAULI_PROD = {
@@ -87,6 +91,15 @@ PAULI_PROD = {
     "XI": ("X", 1.0),
 }
 
+# Integer encoding of the Pauli operators, so that the product of two single qubit
+# operators can be looked up in flat tables indexed by (a << 2) | b
+_OP_TO_INT = {"I": 0, "X": 1, "Y": 2, "Z": 3}
+_INT_TO_OP = "IXYZ"
+_PROD_OP = bytes(
+    _OP_TO_INT[PAULI_PROD[a + b][0]] for a in _INT_TO_OP for b in _INT_TO_OP
+)
+_PROD_COEF = tuple(PAULI_PROD[a + b][1] for a in _INT_TO_OP for b in _INT_TO_OP)
+
 
 class Pauli(Operation):
     """
@@ -137,6 +150,17 @@ class Pauli(Operation):
 
         self.terms = tuple(the_terms)
 
+    @classmethod
+    def _from_terms(cls, terms: Sequence[_CanonicalPauliTerm]) -> "Pauli":
+        """Create an element of the Pauli algebra from terms already in canonical form
+        (Sorted terms of sorted qubits, with no identity operators or zero
+        coefficients), skipping validation. For internal use."""
+        pauli = cls.__new__(cls)
+        qbs = sorted({q for term in terms for q in term[0]})
+        super(Pauli, pauli).__init__(qbs)
+        pauli.terms = tuple(terms)
+        return pauli
+
     # Rename coeff?
     @classmethod
     def term(cls, qubits: Qubits, ops: str, coefficient: Variable = 1.0) -> "Pauli":
@@ -193,13 +217,6 @@ class Pauli(Operation):
         """Return True if this object is the zero Pauli element."""
         return len(self.terms) == 0
 
-    # FIXME?
-    # @property
-    # def qubits(self) -> Qubits:
-    #     """Return a list of qubits acted upon by the Pauli element"""
-    #     return list({q for term, _ in self.terms
-    #                  for q, _ in term})  # type: ignore
-
     def __repr__(self) -> str:
         return "Pauli(" + str(self.terms) + ")"
 
@@ -243,9 +260,9 @@ class Pauli(Operation):
 
     def __mul__(self, other: Any) -> "Pauli":
         if var.is_symbolic(other):
-            other = Pauli.scalar(other)
+            return _pauli_scale(self, other)
         if isinstance(other, Complex):
-            other = Pauli.scalar(complex(other))
+            return _pauli_scale(self, complex(other))
         return pauli_product(self, other)
 
     def __rmul__(self, other: Any) -> "Pauli":
@@ -298,6 +315,11 @@ class Pauli(Operation):
         return self.terms == other.terms
 
     def __hash__(self) -> int:
+        return self._terms_hash
+
+    @cached_property
+    def _terms_hash(self) -> int:
+        # Terms are immutable, so compute the (recursive) tuple hash only once
         return hash(self.terms)
 
     def asoperator(self, qubits: Qubits = None) -> QubitTensor:
@@ -322,19 +344,26 @@ class Pauli(Operation):
             res.append(gate.asoperator() * coeff)
         return cast(np.ndarray, sum(res))
 
-    # TESTME
     def run(self, ket: State) -> State:
-        from .stdgates import STDGATES as NAMED_GATES
-
-        resultants = []
+        # Each Pauli string acts on the ket tensor directly: X flips a qubit's axis,
+        # Z negates the 1 component, and Y = iXZ does both.
+        tensor = ket.tensor
+        out = np.zeros_like(tensor)
         for qbs, ops, coeff in self.terms:
-            res = State(ket.tensor * coeff, ket.qubits)
+            if var.is_symbolic(coeff):
+                coeff = complex(coeff)
+            res = tensor.copy()
             for q, op in zip(qbs, ops):
-                res = NAMED_GATES[op](q).run(res)  # type: ignore
-            resultants.append(res.tensor)
+                axis = ket.qubits.index(q)
+                if op != "X":
+                    res[(slice(None),) * axis + (1,)] *= -1
+                if op != "Z":
+                    res = np.flip(res, axis)
+                if op == "Y":
+                    coeff = coeff * 1j
+            out += coeff * res
 
-        out = State(sum(resultants), ket.qubits)
-        return out
+        return State(out, ket.qubits)
 
     # TESTME (was broken)
     def on(self, *qubits: Qubit) -> "Pauli":
@@ -378,43 +407,191 @@ def sI(qubit: Qubit, coefficient: complex = 1) -> Pauli:
 
 def pauli_sum(*elements: Pauli) -> Pauli:
     """Return the sum of elements of the Pauli algebra"""
-    terms = []
+    coeffs: Dict[Tuple[Tuple[Qubit, ...], str], Variable] = {}
+    for elem in elements:
+        for qbs, ops, coeff in elem.terms:
+            key = (qbs, ops)
+            coeffs[key] = coeffs.get(key, 0) + coeff
 
-    key = itemgetter(0, 1)  # (qbs, str)
-    for term, grp in groupby(heapq.merge(*elements, key=key), key=key):
-        coeff = sum(g[2] for g in grp)
+    terms = []
+    for key in sorted(coeffs):
+        coeff = coeffs[key]
         if not var.almost_zero(coeff):
-            terms.append((term[0], term[1], coeff))
+            terms.append((key[0], key[1], coeff))
 
-    return Pauli(*terms)
+    return Pauli._from_terms(terms)
 
 
 def pauli_product(*elements: Pauli) -> Pauli:
     """Return the product of elements of the Pauli algebra"""
+
+    # Scalar elements (including the identity) only rescale the product of the rest
+    scale: Variable = 1
+    factors = []
+    for elem in elements:
+        if elem.is_zero():
+            return Pauli.zero()
+        if elem.is_scalar():
+            scale = scale * elem.terms[0][2]
+        else:
+            factors.append(elem)
+
+    if not factors:
+        return _pauli_scale(Pauli.identity(), scale)
+
+    if len(factors) == 1:
+        result = factors[0]
+    else:
+        result = _pauli_product_terms(*factors)
+
+    return result if scale == 1 else _pauli_scale(result, scale)
+
+
+def _pauli_scale(element: Pauli, scale: Variable) -> Pauli:
+    """Multiply an element of the Pauli algebra by a scalar"""
+    terms = []
+    for qbs, ops, coeff in element.terms:
+        coeff = coeff * scale
+        if not var.almost_zero(coeff):
+            terms.append((qbs, ops, coeff))
+    return Pauli._from_terms(terms)
+
+
+def _pauli_product_terms(*elements: Pauli) -> Pauli:
+    """Return the product of elements of the Pauli algebra, term by term"""
+    qubits = sorted({q for elem in elements for q in elem.qubits})
+    if len(qubits) <= _MASK_BITS and all(
+        isinstance(t[2], Complex) for elem in elements for t in elem.terms
+    ):
+        result = elements[0]
+        for elem in elements[1:]:
+            result = _pauli_product_masks(result, elem, qubits)
+        return result
+
     result_terms = []
 
     for terms in product(*elements):
-        coeff = reduce(mul, [term[2] for term in terms])
+        coeff: Variable = 1
+        for term in terms:
+            coeff *= term[2]
         ops = (zip(qbs, ops) for qbs, ops, _ in terms)
         out_qubits = []
         out_ops = []
         key = itemgetter(0)
         for qubit, qops in groupby(heapq.merge(*ops, key=key), key=key):
-            res = next(qops)[1]  # Operator: X Y Z
+            res = _OP_TO_INT[next(qops)[1]]  # Operator: X Y Z
             for op in qops:
-                pair = res + op[1]
-                res, rescoeff = PAULI_PROD[pair]
-                coeff *= rescoeff
-            if res != "I":
+                idx = (res << 2) | _OP_TO_INT[op[1]]
+                res = _PROD_OP[idx]
+                coeff *= _PROD_COEF[idx]
+            if res:
                 out_qubits.append(qubit)
-                out_ops.append(res)
+                out_ops.append(_INT_TO_OP[res])
 
-        p = Pauli.term(out_qubits, "".join(out_ops), coeff)
+        p = Pauli._from_terms([(tuple(out_qubits), "".join(out_ops), coeff)])
         result_terms.append(p)
 
     return pauli_sum(*result_terms)
 
 
+# Symplectic representation of Pauli elements. Each term is encoded as a pair of
+# bitmasks over a fixed qubit ordering: bit k of x (z) is set if the operator on the
+# k-th qubit is X or Y (Z or Y), so that X=(1,0), Z=(0,1), and Y=(1,1) (i.e. Y = iXZ).
+# Products, sums and commutation checks of numerical Pauli elements can then be
+# computed with vectorized bitwise operations.
+
+_MASK_BITS = 64
+_MASK_TO_OP = "IXZY"  # Indexed by x | (z << 1)
+_PHASES = np.asarray([1, 1j, -1, -1j])
+
+
+def _popcount(x: np.ndarray) -> np.ndarray:
+    """Count the set bits of each element of an array of unsigned 64 bit integers"""
+    x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + (
+        (x >> np.uint64(2)) & np.uint64(0x3333333333333333)
+    )
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    x = (x * np.uint64(0x0101010101010101)) >> np.uint64(56)
+    return x.astype(np.int64)
+
+
+def _pauli_masks(element: Pauli, qubits: Qubits) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode the terms of a Pauli element as arrays of symplectic bitmasks, with the
+    given qubits assigned to successive bits."""
+    index = {q: 1 << k for k, q in enumerate(qubits)}
+    xs = []
+    zs = []
+    for qbs, ops, _ in element.terms:
+        x = z = 0
+        for q, op in zip(qbs, ops):
+            if op != "Z":
+                x |= index[q]
+            if op != "X":
+                z |= index[q]
+        xs.append(x)
+        zs.append(z)
+
+    return np.asarray(xs, dtype=np.uint64), np.asarray(zs, dtype=np.uint64)
+
+
+def _pauli_coeffs(element: Pauli) -> np.ndarray:
+    """Return the coefficients of a numerical Pauli element as an array"""
+    return np.asarray([complex(t[2]) for t in element.terms], dtype=np.complex128)
+
+
+def _pauli_from_masks(
+    qubits: Qubits, xs: np.ndarray, zs: np.ndarray, coeffs: np.ndarray
+) -> Pauli:
+    """Decode arrays of symplectic bitmasks and coefficients into a Pauli element,
+    combining like terms and dropping terms with negligible coefficients."""
+    if len(coeffs) == 0:
+        return Pauli.zero()
+
+    rows, inverse = np.unique(np.stack([xs, zs], axis=-1), axis=0, return_inverse=True)
+    sums = np.zeros(len(rows), dtype=np.complex128)
+    np.add.at(sums, inverse.reshape(-1), coeffs)
+
+    terms = []
+    for (x, z), coeff in zip(rows.tolist(), sums.tolist()):
+        if abs(coeff) <= ATOL:
+            continue
+        qbs = []
+        ops = []
+        for k, q in enumerate(qubits):
+            op = ((x >> k) & 1) | (((z >> k) & 1) << 1)
+            if op:
+                qbs.append(q)
+                ops.append(_MASK_TO_OP[op])
+        terms.append((tuple(qbs), "".join(ops), coeff))
+    terms.sort(key=itemgetter(0, 1))
+
+    return Pauli._from_terms(terms)
+
+
+def _pauli_product_masks(element0: Pauli, element1: Pauli, qubits: Qubits) -> Pauli:
+    """Product of two numerical Pauli elements in the symplectic representation."""
+    x0, z0 = _pauli_masks(element0, qubits)
+    x1, z1 = _pauli_masks(element1, qubits)
+    c0 = _pauli_coeffs(element0)
+    c1 = _pauli_coeffs(element1)
+
+    x = x0[:, None] ^ x1[None, :]
+    z = z0[:, None] ^ z1[None, :]
+
+    # Per qubit, (i^x0z0 X^x0 Z^z0)(i^x1z1 X^x1 Z^z1) = i^p (i^xz X^x Z^z)
+    # with p = x0z0 + x1z1 + 2 z0x1 - xz (mod 4)
+    phase = (
+        _popcount(x0 & z0)[:, None]
+        + _popcount(x1 & z1)[None, :]
+        + 2 * _popcount(z0[:, None] & x1[None, :])
+        - _popcount(x & z)
+    ) & 3
+    coeffs = c0[:, None] * c1[None, :] * _PHASES[phase]
+
+    return _pauli_from_masks(qubits, x.reshape(-1), z.reshape(-1), coeffs.reshape(-1))
+
+
 # # FIXME DOCME TESTME
 # def pauli_grad(pauli: Pauli, *x: Variable) -> Pauli:
 #     result_terms = []
@@ -442,9 +619,19 @@ def pauli_pow(pauli: Pauli, exponent: int) -> Pauli:
     if exponent == 1:
         return pauli
 
+    return Pauli._from_terms(_pauli_pow_terms(pauli.terms, exponent))
+
+
+@lru_cache(maxsize=256)
+def _pauli_pow_terms(
+    terms: Tuple[_CanonicalPauliTerm, ...], exponent: int
+) -> Tuple[_CanonicalPauliTerm, ...]:
+    # Powers are cached on the (hashable) terms of the Pauli element, since the same
+    # element is often raised to the same power repeatedly (e.g. in Trotter expansions)
+
     # https://en.wikipedia.org/wiki/Exponentiation_by_squaring
     y = Pauli.identity()
-    x = pauli
+    x = Pauli._from_terms(terms)
     n = exponent
     while n > 1:
         if n % 2 == 0:  # Even
@@ -454,7 +641,7 @@ def pauli_pow(pauli: Pauli, exponent: int) -> Pauli:
             y = x * y
             x = x * x
             n = (n - 1) // 2
-    return x * y
+    return (x * y).terms
 
 
 def paulis_close(pauli0: Pauli, pauli1: Pauli, atol: float = ATOL) -> bool:
@@ -473,6 +660,15 @@ def paulis_commute(element0: Pauli, element1: Pauli) -> bool:
     the Raeisi, Wiebe, Sanders algorithm (arXiv:1108.4318, 2011).
     """
 
+    qubits = sorted(set(element0.qubits) | set(element1.qubits))
+    if len(qubits) <= _MASK_BITS:
+        # Two Pauli terms commute if they anti-commute on an even number of qubits,
+        # i.e. if the symplectic inner product x0.z1 + z0.x1 is even.
+        x0, z0 = _pauli_masks(element0, qubits)
+        x1, z1 = _pauli_masks(element1, qubits)
+        anti = (x0[:, None] & z1[None, :]) ^ (z0[:, None] & x1[None, :])
+        return not np.any(_popcount(anti) & 1)
+
     def _coincident_parity(term0: PauliTerm, term1: PauliTerm) -> bool:
         non_similar = 0
         key = itemgetter(0)
@@ -503,6 +699,24 @@ def pauli_commuting_sets(element: Pauli) -> Tuple[Pauli, ...]:
     if len(element) < 2:
         return (element,)
 
+    qubits = element.qubits
+    if len(qubits) <= _MASK_BITS:
+        xs, zs = _pauli_masks(element, qubits)
+        members: List[List[int]] = []
+        for t in range(len(element)):
+            # Terms that do not commute with term t
+            anti = _popcount((xs[t] & zs) ^ (zs[t] & xs)) & 1
+            for member in members:
+                if not anti[member].any():
+                    member.append(t)
+                    break
+            else:
+                members.append([t])
+
+        return tuple(
+            Pauli._from_terms([element.terms[t] for t in member]) for member in members
+        )
+
     groups: List[Pauli] = []
 
     for term in element:
@@ -534,7 +748,7 @@ def pauli_decompose_hermitian(matrix: np.ndarray, qubits: Qubits = None) -> Paul
         raise ValueError("Must be square matrix")
 
     # TODO: Wait is this true?
-    if not np.allclose(matrix.conj().T, matrix):
+    if not np.allclose(matrix.conj().T, matrix, rtol=RTOL, atol=ATOL):
         raise ValueError("Matrix must be Hermitian")
 
     N = int(np.log2(np.size(matrix))) // 2
@@ -16,6 +16,7 @@ import pytest
 import scipy.linalg
 
 import quantumflow as qf
+from quantumflow.config import ATOL
 from quantumflow.paulialgebra import PAULI_OPS, sI, sX, sY, sZ
 
 
@@ -134,6 +135,30 @@ def test_product() -> None:
     assert p == qf.Pauli.term([0, 1], "ZY", -1j)
 
 
+def test_product_polynomials() -> None:
+    qubits = [0, 1, 2]
+    ops = ["".join(ops) for ops in product(PAULI_OPS, repeat=3)]
+    a = qf.pauli_sum(
+        *[qf.Pauli.term(qubits, op, i / 7 - 1j) for i, op in enumerate(ops)]
+    )
+    b = qf.pauli_sum(
+        *[qf.Pauli.term(qubits[1:], op[1:], 0.5 * i) for i, op in enumerate(ops)]
+    )
+
+    ab = qf.pauli_product(a, b)
+    assert np.allclose(
+        ab.asoperator(qubits), a.asoperator(qubits) @ b.asoperator(qubits)
+    )
+
+    abb = qf.pauli_product(a, b, b)
+    assert qf.paulis_close(abb, ab * b)
+
+    # Symbolic coefficients
+    theta = qf.var.Symbol("theta")
+    c = qf.pauli_product(sX(0, theta), sY(0), sZ(1))
+    assert c == qf.Pauli.term([0, 1], "ZZ", 1j * theta)
+
+
 def test_mul() -> None:
     # TODO CHECK ALL PAULI MULTIPLICATIONS HERE
     assert sX(0) * sY(0) == sZ(0, 1j)
@@ -164,6 +189,15 @@ def test_scalar() -> None:
     assert not c.is_scalar()
     assert not c.is_identity()
 
+    theta = qf.var.Symbol("theta")
+    assert sX(0) * theta == sX(0, theta)
+    assert theta * sX(0) == sX(0, theta)
+
+    ident = qf.Pauli.identity()
+    assert qf.pauli_product(ident, sX(0), b, sY(0)) == sZ(0, 2j)
+    assert qf.pauli_product(ident, b) == b
+    assert qf.pauli_product() == ident
+
 
 def test_zero() -> None:
     z = qf.Pauli.scalar(0.0)
@@ -245,6 +279,15 @@ def test_check_commutation() -> None:
     assert qf.paulis_commute(term2, term3)
     assert not qf.paulis_commute(term1, term3)
 
+    # More qubits than fit in the symplectic bitmasks
+    term4 = qf.Pauli.term(range(70), "X" * 70)
+    term5 = qf.Pauli.term(range(70), "Z" * 70)
+    term6 = qf.Pauli.term(range(69), "Z" * 69)
+    assert qf.paulis_commute(term4, term5)
+    assert not qf.paulis_commute(term4, term6)
+    assert term4 * term5 == term5 * term4
+    assert term4 * term6 == -term6 * term4
+
 
 def test_commuting_sets() -> None:
     term1 = sX(0) * sX(1)
@@ -257,6 +300,25 @@ def test_commuting_sets() -> None:
     pcs = qf.pauli_commuting_sets(term1)
     assert len(pcs) == 1
 
+    ps = qf.pauli_sum(
+        *[
+            qf.Pauli.term([0, 1, 2], "".join(ops), 0.5)
+            for ops in product("XYZ", repeat=3)
+        ]
+    )
+    pcs = qf.pauli_commuting_sets(ps)
+    assert qf.pauli_sum(*pcs) == ps
+    for grp in pcs:
+        for t0, t1 in product(grp, grp):
+            assert qf.paulis_commute(qf.Pauli(t0), qf.Pauli(t1))
+
+    # More qubits than fit in the symplectic bitmasks
+    term4 = qf.Pauli.term(range(70), "X" * 70)
+    term5 = qf.Pauli.term(range(70), "Z" * 70)
+    term6 = qf.Pauli.term(range(69), "Z" * 69)
+    pcs = qf.pauli_commuting_sets(term4 + term5 + term6)
+    assert len(pcs) == 2
+
 
 def test_get_qubits() -> None:
     term = sZ(0) * sX(1)
@@ -310,25 +372,34 @@ def test_run() -> None:
     ket0 = qf.zero_state(3)
     _ = s.run(ket0)
 
+    s = s * sZ(0) - 0.3 * sY(0) * sZ(2) + sX(1) * sY(2) * sZ(0) + 0.5
+    ket1 = qf.random_state([0, 1, 2])
+    tensor = ket1.tensor.copy()
+    ket2 = s.run(ket1)
+    assert np.allclose(ket1.tensor, tensor)
+    assert np.allclose(
+        ket2.tensor.flatten(), s.asoperator([0, 1, 2]) @ tensor.flatten()
+    )
+
 
 def test_pauli_decompose_hermitian() -> None:
     gate = qf.X(0)
     H = gate.asoperator()
     pl = qf.pauli_decompose_hermitian(H)
-    assert np.allclose(pl.asoperator(), H)
+    assert np.allclose(pl.asoperator(), H, atol=ATOL)
 
     gate = qf.X(0)
     op = gate.asoperator()
     H = -scipy.linalg.logm(op) / 1.0j
     pl = qf.pauli_decompose_hermitian(H)
-    assert np.allclose(pl.asoperator(), H)
+    assert np.allclose(pl.asoperator(), H, atol=ATOL)
 
     N = 4
     gate2 = qf.RandomGate(range(N))
     op = gate2.asoperator()
     H = -scipy.linalg.logm(op) / 1.0j
     pl = qf.pauli_decompose_hermitian(H)
-    assert np.allclose(pl.asoperator(), H)
+    assert np.allclose(pl.asoperator(), H, atol=ATOL)
 
     op = np.ones(shape=[2, 2, 2])
     with pytest.raises(ValueError):
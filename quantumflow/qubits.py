@@ -47,7 +47,13 @@ def sorted_qubits(qbs: Qubits) -> Qubits:
     Qubits can be of different types, so we sort first by type (as a string),
     then within types.
     """
-    return tuple(sorted(list(set(qbs)), key=lambda x: (str(type(x)), x)))
+    uniq = set(qbs)
+    types = {type(q) for q in uniq}
+    if len(types) <= 1:
+        return tuple(sorted(uniq))
+
+    type_names = {t: str(t) for t in types}
+    return tuple(sorted(uniq, key=lambda x: (type_names[type(x)], x)))
 
 
 # fin
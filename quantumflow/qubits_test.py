@@ -0,0 +1,20 @@
+# Copyright 2020-, Gavin E. Crooks and contributors
+#
+# This source code is licensed under the Apache License, Version 2.0 found in
+# the LICENSE.txt file in the root directory of this source tree.
+
+"""
+Unit tests for quantumflow.qubits
+"""
+
+import quantumflow as qf
+
+
+def test_sorted_qubits() -> None:
+    assert qf.sorted_qubits([]) == ()
+    assert qf.sorted_qubits([2, 0, 1, 0]) == (0, 1, 2)
+    assert qf.sorted_qubits(["b", "a", 3, 1, "b"]) == (1, 3, "a", "b")
+    assert qf.sorted_qubits([(1, "a"), 2, (0, "b")]) == (2, (0, "b"), (1, "a"))
+
+
+# fin
@@ -7,19 +7,36 @@
 
 # DO Rename
 
-from typing import ClassVar, Dict, List, Mapping, Type, TypeVar
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    overload,
+)
 
 import numpy as np
-import scipy
 
-from .. import utils
+from .. import tensors, utils
 from ..config import CONJ, CTRL, SQRT
 from ..ops import _EXCLUDED_OPERATIONS, Gate
 from ..paulialgebra import Pauli, sZ
 from ..qubits import Qubit, Qubits
+from ..states import State
 from ..tensors import QubitTensor, asqutensor
 from ..var import Variable
 
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike  # pragma: no cover
+
 __all__ = (
     "StdGate",
     "STDGATES",
@@ -34,6 +51,9 @@ STDGATES: Dict[str, "Type[StdGate]"] = {}
 STDCTRLGATES: Dict[str, "Type[StdCtrlGate]"] = {}
 """All standard control gates (All non-abstract subclasses of StdCtlGate)"""
 
+StdGateType = TypeVar("StdGateType", bound="StdGate")
+"""Generic type annotations for subtypes of StdGate"""
+
 
 class StdGate(Gate):
     """
@@ -45,6 +65,10 @@ class StdGate(Gate):
     In the argument list, parameters are first, then qubits. Parameters
     have type Variable (either a concrete floating point number, or a symbolic
     expression), and qubits have type Qubit (Any hashable python type).
+
+    The tensors of standard gates are cached and shared between gates of the same
+    type and parameters, and so are read-only. (asoperator() returns a writable
+    copy.)
     """
 
     def __init_subclass__(cls) -> None:
@@ -65,6 +89,16 @@ class StdGate(Gate):
         cls.cv_args = tuple(args)
         cls.cv_qubit_nb = qubit_nb
 
+        # The tensor of a standard gate depends only on the gate type and
+        # parameters, so tensors are cached and shared between instances.
+        # (The descriptor replaces the tensor property that the gate class
+        # defines or inherits, so is installed with setattr.)
+        if qubit_nb:
+            for base in cls.__mro__:
+                if "tensor" in vars(base):
+                    setattr(cls, "tensor", _SharedTensor(vars(base)["tensor"]))
+                    break
+
     def __repr__(self) -> str:
         args: List[str] = []
         args.extend(str(p) for p in self.params)
@@ -73,6 +107,49 @@ class StdGate(Gate):
 
         return f"{self.name}({fargs})"
 
+    @classmethod
+    def operator_batch(cls, *params: "ArrayLike") -> np.ndarray:
+        """Return the operators of this gate type for arrays of parameter values.
+
+        The parameter arrays are broadcast together, and the operators returned
+        as an array of shape (..., 2 ** N, 2 ** N) for an N qubit gate. e.g.
+        Rx.operator_batch(thetas) for a sweep over thetas.
+
+        This generic implementation creates each gate in turn, and so is a fallback
+        for gates without a vectorized closed form (e.g. Rx, ZPow, and controlled
+        versions of such gates), rather than a speedup.
+        """
+        arrays = np.broadcast_arrays(*(np.asarray(p, dtype=float) for p in params))
+        shape = arrays[0].shape if arrays else ()
+        qubits = range(cls.cv_qubit_nb)
+
+        ops = [
+            cls(*(float(a[idx]) for a in arrays), *qubits).asoperator()  # type: ignore
+            for idx in np.ndindex(shape)
+        ]
+        N = 2 ** cls.cv_qubit_nb
+        return np.reshape(ops, shape + (N, N))
+
+    def _with_params(self: StdGateType, *params: Variable) -> StdGateType:
+        """Return a copy of this gate, on the same qubits, with new parameters.
+
+        Skips the argument parsing of __init__, so the parameters must already be
+        valid for this gate type.
+        """
+        return type(self)._from_params(params, self._qubits)
+
+    @classmethod
+    def _from_params(
+        cls: Type[StdGateType], params: Tuple[Variable, ...], qubits: Qubits
+    ) -> StdGateType:
+        """Create a gate of this type from parameters and qubits, skipping the
+        argument parsing and validation of __init__. For internal use."""
+        gate = cls.__new__(cls)
+        gate._qubits = tuple(qubits)
+        gate._params = tuple(params)
+        gate._tensor = None
+        return gate
+
     def _diagram_labels_(self) -> List[str]:
 
         label = self.name
@@ -108,6 +185,62 @@ class StdGate(Gate):
 # End class StdGate
 
 
+class _SharedTensor:
+    """Descriptor for the tensor of a standard gate.
+
+    Tensors are cached by gate type and parameters, so that gates with the same
+    parameters share the same (read-only) tensor. The tensor is also cached on the
+    gate instance, like utils.cached_property.
+    """
+
+    def __init__(self, prop: Any) -> None:
+        if isinstance(prop, _SharedTensor):
+            prop = prop.func
+        self.func: Callable[[StdGate], QubitTensor] = getattr(
+            prop, "func", getattr(prop, "fget", prop)
+        )
+        self.__doc__ = self.func.__doc__
+
+    @overload
+    def __get__(self, instance: None, owner: Type[StdGate]) -> "_SharedTensor":
+        ...
+
+    @overload
+    def __get__(self, instance: StdGate, owner: Type[StdGate]) -> QubitTensor:
+        ...
+
+    def __get__(self, instance: Optional[StdGate], owner: Type[StdGate]) -> Any:
+        if instance is None:
+            return self
+
+        params = instance._params
+        if not params:  # Fixed gates: one tensor per gate type
+            tensor = _std_gate_tensor(type(instance), params, tensors.qubit_dtype)
+        else:
+            try:
+                hash(params)
+            except TypeError:  # Unhashable parameters
+                tensor = self.func(instance)
+            else:
+                tensor = _std_gate_tensor(type(instance), params, tensors.qubit_dtype)
+
+        instance.__dict__["tensor"] = tensor
+        return tensor
+
+
+@lru_cache(maxsize=4096)
+def _std_gate_tensor(
+    gatetype: Type[StdGate], params: Tuple[Variable, ...], dtype: np.dtype
+) -> QubitTensor:
+    # The tensor doesn't depend upon the qubits, so we use placeholders. The dtype
+    # argument is only part of the cache key, since tensors are created with the
+    # current tensors.qubit_dtype.
+    gate = gatetype._from_params(params, range(gatetype.cv_qubit_nb))
+    tensor = vars(gatetype)["tensor"].func(gate)
+    tensor.flags.writeable = False
+    return tensor
+
+
 StdCtrlGateType = TypeVar("StdCtrlGateType", bound="StdCtrlGate")
 """Generic type annotations for subtypes of StdCtrlGate"""
 
@@ -163,14 +296,40 @@ class StdCtrlGate(StdGate):
 
     @utils.cached_property
     def tensor(self) -> QubitTensor:
-        ctrl_block = np.identity(
-            2 ** self.cv_qubit_nb - 2 ** self.cv_target.cv_qubit_nb
-        )
-        target_block = self.target.asoperator()
-        unitary = scipy.linalg.block_diag(ctrl_block, target_block)
+        # Identity, except for the target gate's operator in the last block
+        N = 2 ** self.cv_qubit_nb
+        K = 2 ** self.cv_target.cv_qubit_nb
+        unitary = np.identity(N, dtype=tensors.qubit_dtype)
+        unitary[N - K :, N - K :] = self.target.asoperator()
 
         return asqutensor(unitary)
 
+    @classmethod
+    def operator_batch(cls, *params: "ArrayLike") -> np.ndarray:
+        # As tensor. Vectorized whenever the target gate's operator_batch is.
+        target_ops = cls.cv_target.operator_batch(*params)
+        shape = target_ops.shape[:-2]
+        N = 2 ** cls.cv_qubit_nb
+        K = 2 ** cls.cv_target.cv_qubit_nb
+        ops = np.zeros(shape + (N, N), dtype=tensors.qubit_dtype)
+        ops[..., range(N - K), range(N - K)] = 1
+        ops[..., N - K :, N - K :] = target_ops
+        return ops
+
+    def run(self, ket: State) -> State:
+        if self.cv_tensor_structure == "diagonal":
+            return super().run(ket)
+
+        # Only the amplitudes where every control qubit is 1 are changed, so apply
+        # the target gate to that slice of the state alone.
+        axes = ket.qubit_indices(self.control_qubits)
+        ctrl = utils.multi_slice(axes, [1] * len(axes))
+        qubits = [q for q in ket.qubits if q not in self.control_qubits]
+
+        tensor = ket.tensor.copy()
+        tensor[ctrl] = self.target.run(State(ket.tensor[ctrl], qubits)).tensor
+        return State(tensor, ket.qubits, ket.memory)
+
     def resolve(self: StdCtrlGateType, subs: Mapping[str, float]) -> StdCtrlGateType:
         target = self.target.resolve(subs)
         return type(self)(*target.params, *self.qubits)  # type: ignore
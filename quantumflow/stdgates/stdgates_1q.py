@@ -7,7 +7,19 @@
 Standard one qubit gates
 """
 
-from typing import Dict, List, Type
+import cmath
+import math
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
 
 import numpy as np
 
@@ -19,6 +31,9 @@ from ..tensors import QubitTensor
 from ..var import PI, Variable
 from .stdgates import StdGate
 
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike  # pragma: no cover
+
 __all__ = (
     "I",
     "Ph",
@@ -70,12 +85,52 @@ def _specialize_gate(
     params = [var.asfloat(p) % pd for p, pd in zip(params, periods)]
 
     for values, gatetype in opts.items():
-        if np.isclose(params, values):
+        # Same tolerances as np.isclose, which is slow for scalars
+        if all(abs(p - values) <= 1e-08 + 1e-05 * abs(values) for p in params):
             return gatetype(*gate.qubits)  # type: ignore
 
     return type(gate)(*params, *gate.qubits)  # type: ignore
 
 
+def _fixed_power(
+    gate: StdGate, t: Variable, powers: Sequence[Optional[Type[StdGate]]]
+) -> Optional[StdGate]:
+    """Return an integer power of a fixed gate as another fixed gate, if possible.
+    Used by the __pow__ code of various gates.
+
+    Args:
+        gate:       The gate instance to raise to a power
+        t:          The exponent
+        powers:     The gate types equal to gate ** n for n = 0, 1, 2, ..., over one
+                    period of integer powers (None if there is no such gate)
+    Returns:
+        The gate power, or None if t is not an int with a listed gate.
+    """
+    if not isinstance(t, int):
+        return None
+    gatetype = powers[int(t) % len(powers)]
+    return None if gatetype is None else gatetype._from_params((), gate.qubits)
+
+
+def _operator_batch(
+    shape: Tuple[int, ...],
+    m00: "ArrayLike",
+    m01: "ArrayLike",
+    m10: "ArrayLike",
+    m11: "ArrayLike",
+) -> np.ndarray:
+    """Assemble an array of 1-qubit operators, with shape (..., 2, 2), from
+    (broadcastable) arrays of matrix elements. Used by the operator_batch methods
+    of various gates.
+    """
+    ops = np.empty(shape + (2, 2), dtype=tensors.qubit_dtype)
+    ops[..., 0, 0] = m00
+    ops[..., 0, 1] = m01
+    ops[..., 1, 0] = m10
+    ops[..., 1, 1] = m11
+    return ops
+
+
 # Standard 1 qubit gates
 
 
@@ -147,16 +202,22 @@ class Ph(StdGate):
 
     @utils.cached_property
     def tensor(self) -> QubitTensor:
-        phi = var.asfloat(self.param("phi"))
-        unitary = [[np.exp(1j * phi), 0.0], [0.0, np.exp(1j * phi)]]
+        phase = cmath.exp(1j * var.asfloat(self.param("phi")))
+        unitary = [[phase, 0.0], [0.0, phase]]
         return tensors.asqutensor(unitary)
 
+    @classmethod
+    def operator_batch(cls, *params: "ArrayLike") -> np.ndarray:
+        (phi,) = params
+        phase = np.exp(1j * np.asarray(phi, dtype=float))
+        return _operator_batch(phase.shape, phase, 0.0, 0.0, phase)
+
     @property
     def H(self) -> "Ph":
         return self ** -1
 
     def __pow__(self, t: Variable) -> "Ph":
-        return Ph(t * self.param("phi"), *self.qubits)
+        return self._with_params(t * self.param("phi"))
 
     def run(self, ket: State) -> State:
         (phi,) = self.params
@@ -199,13 +260,23 @@ class X(StdGate):
     def H(self) -> "X":
         return self  # Hermitian
 
+    @overload
+    def __pow__(self, t: int) -> "Union[I, X]":
+        ...  # pragma: no cover
+
+    @overload  # noqa: F811
     def __pow__(self, t: Variable) -> "XPow":
-        return XPow(t, *self.qubits)
+        ...  # pragma: no cover
+
+    def __pow__(self, t: Variable) -> StdGate:  # noqa: F811
+        gate = _fixed_power(self, t, (I, X))
+        return gate if gate is not None else XPow(t, *self.qubits)
 
     def run(self, ket: State) -> State:
+        # Flip the qubit's axis. (np.flip returns a view, so copy, lest the new
+        # state share data with the old.)
         (idx,) = ket.qubit_indices(self.qubits)
-        take = utils.multi_slice(axes=[idx], items=[[1, 0]])
-        tensor = ket.tensor[take]
+        tensor = np.flip(ket.tensor, idx).copy()
         return State(tensor, ket.qubits, ket.memory)
 
 
@@ -241,14 +312,26 @@ class Y(StdGate):
     def H(self) -> "Y":
         return self  # Hermitian
 
+    @overload
+    def __pow__(self, t: int) -> "Union[I, Y]":
+        ...  # pragma: no cover
+
+    @overload  # noqa: F811
     def __pow__(self, t: Variable) -> "YPow":
-        return YPow(t, *self.qubits)
+        ...  # pragma: no cover
+
+    def __pow__(self, t: Variable) -> StdGate:  # noqa: F811
+        gate = _fixed_power(self, t, (I, Y))
+        return gate if gate is not None else YPow(t, *self.qubits)
 
     def run(self, ket: State) -> State:
-        # This is fast Since X and Z have fast optimizations.
-        ket = Z(*self.qubits).run(ket)
-        ket = X(*self.qubits).run(ket)
-        return ket
+        # Flip the qubit's axis (as for X) and apply the phases in a single pass
+        (idx,) = ket.qubit_indices(self.qubits)
+        shape = [1] * ket.qubit_nb
+        shape[idx] = 2
+        phases = np.reshape(tensors.asqutensor([-1.0j, 1.0j]), shape)
+        tensor = np.flip(ket.tensor, idx) * phases
+        return State(tensor, ket.qubits, ket.memory)
 
 
 # end class Y
@@ -281,8 +364,17 @@ class Z(StdGate):
     def H(self) -> "Z":
         return self  # Hermitian
 
+    @overload
+    def __pow__(self, t: int) -> "Union[I, Z]":
+        ...  # pragma: no cover
+
+    @overload  # noqa: F811
     def __pow__(self, t: Variable) -> "ZPow":
-        return ZPow(t, *self.qubits)
+        ...  # pragma: no cover
+
+    def __pow__(self, t: Variable) -> StdGate:  # noqa: F811
+        gate = _fixed_power(self, t, (I, Z))
+        return gate if gate is not None else ZPow(t, *self.qubits)
 
     def run(self, ket: State) -> State:
         return ZPow(1, *self.qubits).run(ket)
@@ -318,8 +410,17 @@ class H(StdGate):
     def H(self) -> "_H":  # See NB implementation note below
         return self  # Hermitian
 
+    @overload
+    def __pow__(self, t: int) -> "Union[I, _H]":
+        ...  # pragma: no cover
+
+    @overload  # noqa: F811
     def __pow__(self, t: Variable) -> "HPow":
-        return HPow(t, *self.qubits)
+        ...  # pragma: no cover
+
+    def __pow__(self, t: Variable) -> StdGate:  # noqa: F811
+        gate = _fixed_power(self, t, (I, H))
+        return gate if gate is not None else HPow(t, *self.qubits)
 
     def run(self, ket: State) -> State:
         axes = ket.qubit_indices(self.qubits)
@@ -366,10 +467,19 @@ class S(StdGate):
 
     @property
     def H(self) -> "S_H":
-        return S_H(*self.qubits)
+        return S_H._from_params((), self._qubits)
 
+    @overload
+    def __pow__(self, t: int) -> "Union[I, S, Z, S_H]":
+        ...  # pragma: no cover
+
+    @overload  # noqa: F811
     def __pow__(self, t: Variable) -> "ZPow":
-        return ZPow(t / 2, *self.qubits)
+        ...  # pragma: no cover
+
+    def __pow__(self, t: Variable) -> StdGate:  # noqa: F811
+        gate = _fixed_power(self, t, (I, S, Z, S_H))
+        return gate if gate is not None else ZPow(t / 2, *self.qubits)
 
     def run(self, ket: State) -> State:
         return ZPow(1 / 2, *self.qubits).run(ket)
@@ -398,15 +508,24 @@ class T(StdGate):
 
     @utils.cached_property
     def tensor(self) -> QubitTensor:
-        unitary = [[1.0, 0.0], [0.0, np.exp(1j * np.pi / 4.0)]]
+        unitary = [[1.0, 0.0], [0.0, (1 + 1j) / np.sqrt(2)]]
         return tensors.asqutensor(unitary)
 
     @property
     def H(self) -> "T_H":
-        return T_H(*self.qubits)
+        return T_H._from_params((), self._qubits)
+
+    @overload
+    def __pow__(self, t: int) -> "Union[I, T, S, Z, S_H, T_H, ZPow]":
+        ...  # pragma: no cover
 
+    @overload  # noqa: F811
     def __pow__(self, t: Variable) -> "ZPow":
-        return ZPow(t / 4, *self.qubits)
+        ...  # pragma: no cover
+
+    def __pow__(self, t: Variable) -> StdGate:  # noqa: F811
+        gate = _fixed_power(self, t, (I, T, S, None, Z, None, S_H, T_H))
+        return gate if gate is not None else ZPow(t / 4, *self.qubits)
 
     def run(self, ket: State) -> State:
         return ZPow(1 / 4, *self.qubits).run(ket)
@@ -438,15 +557,21 @@ class PhaseShift(StdGate):
     @utils.cached_property
     def tensor(self) -> QubitTensor:
         theta = var.asfloat(self.param("theta"))
-        unitary = [[1.0, 0.0], [0.0, np.exp(1j * theta)]]
+        unitary: List[List[complex]] = [[1.0, 0.0], [0.0, cmath.exp(1j * theta)]]
         return tensors.asqutensor(unitary)
 
+    @classmethod
+    def operator_batch(cls, *params: "ArrayLike") -> np.ndarray:
+        (param,) = params
+        theta = np.asarray(param, dtype=float)
+        return _operator_batch(theta.shape, 1.0, 0.0, 0.0, np.exp(1j * theta))
+
     @property
     def H(self) -> "PhaseShift":
         return self ** -1
 
     def __pow__(self, t: Variable) -> "PhaseShift":
-        return PhaseShift(self.param("theta") * t, *self.qubits)
+        return self._with_params(self.param("theta") * t)
 
     def run(self, ket: State) -> State:
         (theta,) = self.params
@@ -492,18 +617,25 @@ class Rx(StdGate):
     @utils.cached_property
     def tensor(self) -> QubitTensor:
         theta = var.asfloat(self.param("theta"))
-        unitary = [
-            [np.cos(theta / 2), -1.0j * np.sin(theta / 2)],
-            [-1.0j * np.sin(theta / 2), np.cos(theta / 2)],
-        ]
+        cost = math.cos(theta / 2)
+        sint = math.sin(theta / 2)
+        unitary = [[cost, -1.0j * sint], [-1.0j * sint, cost]]
         return tensors.asqutensor(unitary)
 
+    @classmethod
+    def operator_batch(cls, *params: "ArrayLike") -> np.ndarray:
+        (param,) = params
+        theta = np.asarray(param, dtype=float)
+        cost = np.cos(theta / 2)
+        sint = np.sin(theta / 2)
+        return _operator_batch(theta.shape, cost, -1.0j * sint, -1.0j * sint, cost)
+
     @property
     def H(self) -> "Rx":
         return self ** -1
 
     def __pow__(self, t: Variable) -> "Rx":
-        return Rx(self.param("theta") * t, *self.qubits)
+        return self._with_params(self.param("theta") * t)
 
     def specialize(self) -> StdGate:
         qbs = self.qubits
@@ -542,18 +674,25 @@ class Ry(StdGate):
     @utils.cached_property
     def tensor(self) -> QubitTensor:
         theta = var.asfloat(self.param("theta"))
-        unitary = [
-            [np.cos(theta / 2.0), -np.sin(theta / 2.0)],
-            [np.sin(theta / 2.0), np.cos(theta / 2.0)],
-        ]
+        cost = math.cos(theta / 2)
+        sint = math.sin(theta / 2)
+        unitary = [[cost, -sint], [sint, cost]]
         return tensors.asqutensor(unitary)
 
+    @classmethod
+    def operator_batch(cls, *params: "ArrayLike") -> np.ndarray:
+        (param,) = params
+        theta = np.asarray(param, dtype=float)
+        cost = np.cos(theta / 2)
+        sint = np.sin(theta / 2)
+        return _operator_batch(theta.shape, cost, -sint, sint, cost)
+
     @property
     def H(self) -> "Ry":
         return self ** -1
 
     def __pow__(self, t: Variable) -> "Ry":
-        return Ry(self.param("theta") * t, *self.qubits)
+        return self._with_params(self.param("theta") * t)
 
     def specialize(self) -> StdGate:
         qbs = self.qubits
@@ -591,20 +730,23 @@ class Rz(StdGate):
 
     @utils.cached_property
     def tensor(self) -> QubitTensor:
-        theta = var.asfloat(self.param("theta"))
-        unitary = [[np.exp(-theta * 0.5j), 0], [0, np.exp(theta * 0.5j)]]
+        phase = cmath.exp(0.5j * var.asfloat(self.param("theta")))
+        unitary = [[1 / phase, 0.0], [0.0, phase]]
         return tensors.asqutensor(unitary)
 
+    @classmethod
+    def operator_batch(cls, *params: "ArrayLike") -> np.ndarray:
+        (param,) = params
+        theta = np.asarray(param, dtype=float)
+        phase = np.exp(0.5j * theta)
+        return _operator_batch(theta.shape, 1 / phase, 0.0, 0.0, phase)
+
     @property
     def H(self) -> "Rz":
         return self ** -1
 
     def __pow__(self, t: Variable) -> "Rz":
-        return Rz(self.param("theta") * t, *self.qubits)
-
-    def run(self, ket: State) -> State:
-        (theta,) = self.params
-        return ZPow(theta / np.pi, *self.qubits).run(ket)
+        return self._with_params(self.param("theta") * t)
 
     def specialize(self) -> StdGate:
         qbs = self.qubits
@@ -647,10 +789,19 @@ class S_H(StdGate):
 
     @property
     def H(self) -> "S":
-        return S(*self.qubits)
+        return S._from_params((), self._qubits)
 
+    @overload
+    def __pow__(self, t: int) -> "Union[I, S_H, Z, S]":
+        ...  # pragma: no cover
+
+    @overload  # noqa: F811
     def __pow__(self, t: Variable) -> "ZPow":
-        return ZPow(-t / 2, *self.qubits)
+        ...  # pragma: no cover
+
+    def __pow__(self, t: Variable) -> StdGate:  # noqa: F811
+        gate = _fixed_power(self, t, (I, S_H, Z, S))
+        return gate if gate is not None else ZPow(-t / 2, *self.qubits)
 
     def run(self, ket: State) -> State:
         return ZPow(-1 / 2, *self.qubits).run(ket)
@@ -679,15 +830,24 @@ class T_H(StdGate):
 
     @utils.cached_property
     def tensor(self) -> QubitTensor:
-        unitary = [[1.0, 0.0], [0.0, np.exp(-1j * np.pi / 4.0)]]
+        unitary = [[1.0, 0.0], [0.0, (1 - 1j) / np.sqrt(2)]]
         return tensors.asqutensor(unitary)
 
     @property
     def H(self) -> "T":
-        return T(*self.qubits)
+        return T._from_params((), self._qubits)
 
+    @overload
+    def __pow__(self, t: int) -> "Union[I, T_H, S_H, Z, S, T, ZPow]":
+        ...  # pragma: no cover
+
+    @overload  # noqa: F811
     def __pow__(self, t: Variable) -> "ZPow":
-        return ZPow(-t / 4, *self.qubits)
+        ...  # pragma: no cover
+
+    def __pow__(self, t: Variable) -> StdGate:  # noqa: F811
+        gate = _fixed_power(self, t, (I, T_H, S_H, None, Z, None, S, T))
+        return gate if gate is not None else ZPow(-t / 4, *self.qubits)
 
     def run(self, ket: State) -> State:
         return ZPow(-1 / 4, *self.qubits).run(ket)
@@ -734,8 +894,8 @@ class Rn(StdGate):
         ny = var.asfloat(self.param("ny"))
         nz = var.asfloat(self.param("nz"))
 
-        cost = np.cos(theta / 2)
-        sint = np.sin(theta / 2)
+        cost = math.cos(theta / 2)
+        sint = math.sin(theta / 2)
         unitary = [
             [cost - 1j * sint * nz, -1j * sint * nx - sint * ny],
             [-1j * sint * nx + sint * ny, cost + 1j * sint * nz],
@@ -778,20 +938,28 @@ class XPow(StdGate):
 
     @utils.cached_property
     def tensor(self) -> QubitTensor:
-        theta = np.pi * var.asfloat(self.param("t"))
-        phase = np.exp(0.5j * theta)
-        unitary = [
-            [phase * np.cos(theta / 2), phase * -1.0j * np.sin(theta / 2)],
-            [phase * -1.0j * np.sin(theta / 2), phase * np.cos(theta / 2)],
-        ]
+        theta = math.pi * var.asfloat(self.param("t"))
+        phase = cmath.exp(0.5j * theta)
+        cost = phase * math.cos(theta / 2)
+        sint = phase * -1.0j * math.sin(theta / 2)
+        unitary = [[cost, sint], [sint, cost]]
         return tensors.asqutensor(unitary)
 
+    @classmethod
+    def operator_batch(cls, *params: "ArrayLike") -> np.ndarray:
+        (t,) = params
+        theta = np.pi * np.asarray(t, dtype=float)
+        phase = np.exp(0.5j * theta)
+        cost = phase * np.cos(theta / 2)
+        sint = phase * -1.0j * np.sin(theta / 2)
+        return _operator_batch(theta.shape, cost, sint, sint, cost)
+
     @property
     def H(self) -> "XPow":
         return self ** -1
 
     def __pow__(self, t: Variable) -> "XPow":
-        return XPow(t * self.param("t"), *self.qubits)
+        return self._with_params(t * self.param("t"))
 
     def specialize(self) -> StdGate:
         opts = {0.0: I, 0.5: V, 1.0: X, 1.5: V_H, 2.0: I}
@@ -825,20 +993,28 @@ class YPow(StdGate):
 
     @utils.cached_property
     def tensor(self) -> QubitTensor:
-        theta = np.pi * var.asfloat(self.param("t"))
-        phase = np.exp(0.5j * theta)
-        unitary = [
-            [phase * np.cos(theta / 2.0), phase * -np.sin(theta / 2.0)],
-            [phase * np.sin(theta / 2.0), phase * np.cos(theta / 2.0)],
-        ]
+        theta = math.pi * var.asfloat(self.param("t"))
+        phase = cmath.exp(0.5j * theta)
+        cost = phase * math.cos(theta / 2)
+        sint = phase * math.sin(theta / 2)
+        unitary = [[cost, -sint], [sint, cost]]
         return tensors.asqutensor(unitary)
 
+    @classmethod
+    def operator_batch(cls, *params: "ArrayLike") -> np.ndarray:
+        (t,) = params
+        theta = np.pi * np.asarray(t, dtype=float)
+        phase = np.exp(0.5j * theta)
+        cost = phase * np.cos(theta / 2)
+        sint = phase * np.sin(theta / 2)
+        return _operator_batch(theta.shape, cost, -sint, sint, cost)
+
     @property
     def H(self) -> "YPow":
         return self ** -1
 
     def __pow__(self, t: Variable) -> "YPow":
-        return YPow(t * self.param("t"), *self.qubits)
+        return self._with_params(t * self.param("t"))
 
     def specialize(self) -> StdGate:
         opts = {0.0: I, 1.0: Y, 2.0: I}
@@ -870,20 +1046,22 @@ class ZPow(StdGate):
 
     @utils.cached_property
     def tensor(self) -> QubitTensor:
-        theta = np.pi * var.asfloat(self.param("t"))
-        phase = np.exp(0.5j * theta)
-        unitary = [
-            [phase * np.exp(-theta * 0.5j), 0],
-            [0, phase * np.exp(theta * 0.5j)],
-        ]
+        theta = math.pi * var.asfloat(self.param("t"))
+        unitary: List[List[complex]] = [[1.0, 0.0], [0.0, cmath.exp(1j * theta)]]
         return tensors.asqutensor(unitary)
 
+    @classmethod
+    def operator_batch(cls, *params: "ArrayLike") -> np.ndarray:
+        (t,) = params
+        theta = np.pi * np.asarray(t, dtype=float)
+        return _operator_batch(theta.shape, 1.0, 0.0, 0.0, np.exp(1j * theta))
+
     @property
     def H(self) -> "ZPow":
-        return ZPow(-self.param("t"), *self.qubits)
+        return self._with_params(-self.param("t"))
 
     def __pow__(self, t: Variable) -> "ZPow":
-        return ZPow(t * self.param("t"), *self.qubits)
+        return self._with_params(t * self.param("t"))
 
     def run(self, ket: State) -> State:
         t = var.asfloat(self.param("t"))
@@ -924,20 +1102,11 @@ class HPow(StdGate):
 
     @utils.cached_property
     def tensor(self) -> QubitTensor:
-        theta = np.pi * var.asfloat(self.param("t"))
-        phase = np.exp(0.5j * theta)
-        unitary = [
-            [
-                phase * np.cos(theta / 2)
-                - (phase * 1.0j * np.sin(theta / 2)) / np.sqrt(2),
-                -(phase * 1.0j * np.sin(theta / 2)) / np.sqrt(2),
-            ],
-            [
-                -(phase * 1.0j * np.sin(theta / 2)) / np.sqrt(2),
-                phase * np.cos(theta / 2)
-                + (phase * 1.0j * np.sin(theta / 2)) / np.sqrt(2),
-            ],
-        ]
+        theta = math.pi * var.asfloat(self.param("t"))
+        phase = cmath.exp(0.5j * theta)
+        cost = phase * math.cos(theta / 2)
+        sint = phase * 1.0j * math.sin(theta / 2) / math.sqrt(2)
+        unitary = [[cost - sint, -sint], [-sint, cost + sint]]
         return tensors.asqutensor(unitary)
 
     @property
@@ -945,7 +1114,7 @@ class HPow(StdGate):
         return self ** -1
 
     def __pow__(self, t: Variable) -> "HPow":
-        return HPow(t * self.param("t"), *self.qubits)
+        return self._with_params(t * self.param("t"))
 
     def specialize(self) -> StdGate:
         opts = {0.0: I, 1.0: H, 2.0: I}
@@ -970,14 +1139,24 @@ class V(StdGate):
 
     @utils.cached_property
     def tensor(self) -> QubitTensor:
-        return XPow(0.5, *self.qubits).tensor
+        unitary = np.asarray([[1 + 1j, 1 - 1j], [1 - 1j, 1 + 1j]]) / 2
+        return tensors.asqutensor(unitary)
 
     @property
     def H(self) -> "V_H":
-        return V_H(*self.qubits)
+        return V_H._from_params((), self._qubits)
 
+    @overload
+    def __pow__(self, t: int) -> "Union[I, V, X, V_H]":
+        ...  # pragma: no cover
+
+    @overload  # noqa: F811
     def __pow__(self, t: Variable) -> "XPow":
-        return XPow(0.5 * t, *self.qubits)
+        ...  # pragma: no cover
+
+    def __pow__(self, t: Variable) -> StdGate:  # noqa: F811
+        gate = _fixed_power(self, t, (I, V, X, V_H))
+        return gate if gate is not None else XPow(0.5 * t, *self.qubits)
 
 
 # end class V
@@ -998,14 +1177,24 @@ class V_H(StdGate):
 
     @utils.cached_property
     def tensor(self) -> QubitTensor:
-        return XPow(-0.5, *self.qubits).tensor
+        unitary = np.asarray([[1 - 1j, 1 + 1j], [1 + 1j, 1 - 1j]]) / 2
+        return tensors.asqutensor(unitary)
 
     @property
     def H(self) -> "V":
-        return V(*self.qubits)
+        return V._from_params((), self._qubits)
+
+    @overload
+    def __pow__(self, t: int) -> "Union[I, V_H, X, V]":
+        ...  # pragma: no cover
 
+    @overload  # noqa: F811
     def __pow__(self, t: Variable) -> "XPow":
-        return XPow(-0.5 * t, *self.qubits)
+        ...  # pragma: no cover
+
+    def __pow__(self, t: Variable) -> StdGate:  # noqa: F811
+        gate = _fixed_power(self, t, (I, V_H, X, V))
+        return gate if gate is not None else XPow(-0.5 * t, *self.qubits)
 
 
 # end class V_H
@@ -1026,14 +1215,24 @@ class SqrtY(StdGate):
 
     @utils.cached_property
     def tensor(self) -> QubitTensor:
-        return YPow(0.5, *self.qubits).tensor
+        unitary = np.asarray([[1 + 1j, -1 - 1j], [1 + 1j, 1 + 1j]]) / 2
+        return tensors.asqutensor(unitary)
 
     @property
     def H(self) -> "SqrtY_H":
-        return SqrtY_H(*self.qubits)
+        return SqrtY_H._from_params((), self._qubits)
+
+    @overload
+    def __pow__(self, t: int) -> "Union[I, SqrtY, Y, SqrtY_H]":
+        ...  # pragma: no cover
 
+    @overload  # noqa: F811
     def __pow__(self, t: Variable) -> "YPow":
-        return YPow(0.5 * t, *self.qubits)
+        ...  # pragma: no cover
+
+    def __pow__(self, t: Variable) -> StdGate:  # noqa: F811
+        gate = _fixed_power(self, t, (I, SqrtY, Y, SqrtY_H))
+        return gate if gate is not None else YPow(0.5 * t, *self.qubits)
 
 
 # end class SqrtY
@@ -1054,14 +1253,24 @@ class SqrtY_H(StdGate):
 
     @utils.cached_property
     def tensor(self) -> QubitTensor:
-        return YPow(-0.5, *self.qubits).tensor
+        unitary = np.asarray([[1 - 1j, 1 - 1j], [-1 + 1j, 1 - 1j]]) / 2
+        return tensors.asqutensor(unitary)
 
     @property
     def H(self) -> "SqrtY":
-        return SqrtY(*self.qubits)
+        return SqrtY._from_params((), self._qubits)
 
+    @overload
+    def __pow__(self, t: int) -> "Union[I, SqrtY_H, Y, SqrtY]":
+        ...  # pragma: no cover
+
+    @overload  # noqa: F811
     def __pow__(self, t: Variable) -> "YPow":
-        return YPow(-0.5 * t, *self.qubits)
+        ...  # pragma: no cover
+
+    def __pow__(self, t: Variable) -> StdGate:  # noqa: F811
+        gate = _fixed_power(self, t, (I, SqrtY_H, Y, SqrtY))
+        return gate if gate is not None else YPow(-0.5 * t, *self.qubits)
 
 
 # end class SqrtY_H
@@ -22,6 +22,35 @@ def test_XPow() -> None:
     assert qf.gates_close(qf.V(0) @ qf.V(0), qf.X(0))
 
 
+def test_X_run() -> None:
+    ket0 = qf.random_state([0, 1, 2])
+    ket1 = qf.X(1).run(ket0)
+    assert qf.states_close(ket1, qf.Unitary(qf.X(1).tensor, [1]).run(ket0))
+
+    # The new state must not share data with the old
+    assert not np.shares_memory(ket0.tensor, ket1.tensor)
+
+
+def test_fixed_gate_tensors() -> None:
+    # Parameter free gates have closed form tensors
+    for gate, gate2 in [
+        (qf.V(0), qf.X(0)),
+        (qf.V_H(0), qf.X(0)),
+        (qf.SqrtY(0), qf.Y(0)),
+        (qf.SqrtY_H(0), qf.Y(0)),
+        (qf.S(0), qf.Z(0)),
+        (qf.S_H(0), qf.Z(0)),
+    ]:
+        U = gate.asoperator()
+        assert np.all(U @ U == gate2.asoperator())
+        assert np.all(U @ gate.H.asoperator() == np.eye(2))
+
+    assert qf.gates_close(qf.SqrtY(0), qf.YPow(0.5, 0))
+    assert qf.gates_close(qf.SqrtY_H(0), qf.YPow(-0.5, 0))
+    assert qf.gates_close(qf.T(0) @ qf.T(0), qf.S(0))
+    assert qf.gates_close(qf.T_H(0) @ qf.T_H(0), qf.S_H(0))
+
+
 def test_rn() -> None:
     theta = 1.23
 
@@ -95,6 +124,8 @@ def test_specialize_1q() -> None:
     assert isinstance(qf.ZPow(1.5, q0).specialize(), qf.S_H)
     assert isinstance(qf.ZPow(1.75, q0).specialize(), qf.T_H)
     assert isinstance(qf.ZPow(1.99999999999, q0).specialize(), qf.I)
+    assert isinstance(qf.ZPow(0.2500001, q0).specialize(), qf.T)
+    assert isinstance(qf.ZPow(0.2501, q0).specialize(), qf.ZPow)
 
     special_values = (
         0.0,
@@ -133,4 +164,30 @@ def test_specialize_1q() -> None:
     assert isinstance(qf.PhasedXPow(0.0213, 1.0, 1).specialize(), qf.PhasedXPow)
 
 
+def test_fixed_gate_powers() -> None:
+    q0 = 3
+    assert isinstance(qf.X(q0) ** 2, qf.I)
+    assert isinstance(qf.H(q0) ** -2, qf.I)
+    assert isinstance(qf.S(q0) ** 2, qf.Z)
+    assert isinstance(qf.S(q0) ** -1, qf.S_H)
+    assert isinstance(qf.T(q0) ** 2, qf.S)
+    assert isinstance(qf.T(q0) ** 3, qf.ZPow)
+    assert isinstance(qf.V(q0) ** 2, qf.X)
+    assert isinstance(qf.V(q0) ** 0.5, qf.XPow)
+    assert isinstance(qf.X(q0) ** 2.0, qf.XPow)  # Only int powers are fixed gates
+    assert (qf.S(q0) ** 2).qubits == (q0,)
+
+    gates = [qf.X(q0), qf.Y(q0), qf.Z(q0), qf.H(q0), qf.S(q0), qf.T(q0)]
+    for gate in gates + [qf.S_H(q0), qf.T_H(q0)]:
+        for n in range(-8, 9):
+            op = np.linalg.matrix_power(gate.asoperator(), abs(n))
+            if n < 0:
+                op = op.conj().T
+            assert np.allclose((gate ** n).asoperator(), op)  # Including phase
+
+    for gate in [qf.V(q0), qf.V_H(q0), qf.SqrtY(q0), qf.SqrtY_H(q0)]:
+        assert qf.gates_phase_close(gate ** 3, gate @ gate @ gate)
+        assert qf.gates_phase_close(gate ** -1, gate.H)
+
+
 # fin
@@ -521,7 +521,7 @@ class CV(StdCtrlGate):
 
     @property
     def H(self) -> "CV_H":
-        return CV_H(*self.qubits)
+        return CV_H._from_params((), self._qubits)
 
     def __pow__(self, t: Variable) -> "CNotPow":
         return CNotPow(t / 2, *self.qubits)
@@ -540,7 +540,7 @@ class CV_H(StdCtrlGate):
 
     @property
     def H(self) -> "CV":
-        return CV(*self.qubits)
+        return CV._from_params((), self._qubits)
 
     def __pow__(self, t: Variable) -> "CNotPow":
         return CNotPow(-t / 2, *self.qubits)
@@ -818,7 +818,7 @@ class SqrtISwap(StdGate):
 
     @property
     def H(self) -> "SqrtISwap_H":
-        return SqrtISwap_H(*self.qubits)
+        return SqrtISwap_H._from_params((), self._qubits)
 
     def __pow__(self, t: Variable) -> "XY":
         return XY(-t / 4, *self.qubits)
@@ -848,7 +848,7 @@ class SqrtISwap_H(StdGate):
 
     @property
     def H(self) -> "SqrtISwap":
-        return SqrtISwap(*self.qubits)
+        return SqrtISwap._from_params((), self._qubits)
 
     def __pow__(self, t: Variable) -> "XY":
         return XY(t / 4, *self.qubits)
@@ -878,7 +878,7 @@ class SqrtSwap(StdGate):
 
     @property
     def H(self) -> "SqrtSwap_H":
-        return SqrtSwap_H(*self.qubits)
+        return SqrtSwap_H._from_params((), self._qubits)
 
     def __pow__(self, t: Variable) -> "Exch":
         return Exch(t / 4, *self.qubits)
@@ -909,7 +909,7 @@ class SqrtSwap_H(StdGate):
 
     @property
     def H(self) -> "SqrtSwap":
-        return SqrtSwap(*self.qubits)
+        return SqrtSwap._from_params((), self._qubits)
 
     def __pow__(self, t: Variable) -> "Exch":
         return Exch(-t / 4, *self.qubits)
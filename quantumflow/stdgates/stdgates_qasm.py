@@ -107,7 +107,7 @@ from typing import List
 
 import numpy as np
 
-from .. import tensors
+from .. import tensors, var
 from ..config import CTRL
 from ..qubits import Qubit
 from ..tensors import QubitTensor
@@ -115,7 +115,7 @@ from ..utils import cached_property
 from ..var import Variable
 from .stdgates import StdCtrlGate, StdGate
 from .stdgates_1q import PhaseShift, Rx, Ry, Rz
-from .stdgates_2q import XX, YY, ZZ, CNot
+from .stdgates_2q import XX, YY
 from .stdgates_forest import CPhase
 
 __all__ = ("U3", "U2", "CU3", "CRZ", "RZZ", "CRx", "CRy", "CRz", "Rxx", "Ryy", "Rzz")
@@ -145,9 +145,7 @@ class U3(StdGate):
 
     @cached_property
     def tensor(self) -> QubitTensor:
-        theta = self.float_param("theta")
-        phi = self.float_param("phi")
-        lam = self.float_param("lam")
+        theta, phi, lam = [var.asfloat(v) for v in self.params]
 
         unitary = [
             [np.cos(theta / 2.0), -np.sin(theta / 2.0) * np.exp(1j * lam)],
@@ -215,31 +213,31 @@ class CU3(StdGate):
 
     @cached_property
     def tensor(self) -> QubitTensor:
-        theta = self.float_param("theta")
-        phi = self.float_param("phi")
-        lam = self.float_param("lam")
+        theta, phi, lam = [var.asfloat(v) for v in self.params]
 
         # Note: Gate is defined via this circuit in QASM
+        #   PhaseShift((lam + phi) / 2, 0)
+        #   PhaseShift((lam - phi) / 2, 1)
+        #   CNot(0, 1)
+        #   U3(-theta / 2, 0.0, -(phi + lam) / 2, 1)
+        #   CNot(0, 1)
+        #   U3(theta / 2, phi, 0.0, 1)
         # Except for first line, which was added to qsikit to make the
         # definitions of cu3 and u3 in qsikit consistent.
         # https://github.com/Qiskit/qiskit-terra/pull/2755
         # That seems silly. They should have fixed the phase of u3 to match
         # the definition in the QASM paper, not change the cu3 gate to
         # something entirely different.
-        from ..circuits import Circuit
-
-        circ = Circuit(
-            [
-                PhaseShift((lam + phi) / 2, 0),
-                PhaseShift((lam - phi) / 2, 1),
-                CNot(0, 1),
-                U3(-theta / 2, 0.0, -(phi + lam) / 2, 1),
-                CNot(0, 1),
-                U3(theta / 2, phi, 0.0, 1),
-            ]
-        )
-
-        return circ.asgate().tensor
+        # With that first line, the circuit is exactly a controlled U3 gate.
+        cos = np.cos(theta / 2.0)
+        sin = np.sin(theta / 2.0)
+        unitary = [
+            [1, 0, 0, 0],
+            [0, 1, 0, 0],
+            [0, 0, cos, -sin * np.exp(1j * lam)],
+            [0, 0, sin * np.exp(1j * phi), cos * np.exp(1j * (phi + lam))],
+        ]
+        return tensors.asqutensor(unitary)
 
     @property
     def H(self) -> "CU3":
@@ -385,9 +383,10 @@ class Rzz(StdGate):
 
     @cached_property
     def tensor(self) -> QubitTensor:
-        q0, q1 = self.qubits
-        (theta,) = self.params
-        return ZZ(theta / np.pi, q0, q1).tensor
+        theta = self.float_param("theta")
+        phase = np.exp(1j * theta / 2)
+        unitary = np.diag([1 / phase, phase, phase, 1 / phase])
+        return tensors.asqutensor(unitary)
 
     @property
     def H(self) -> "Rzz":
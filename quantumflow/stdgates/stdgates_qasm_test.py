@@ -58,6 +58,21 @@ def test_CU3() -> None:
     cgate = qf.ControlGate(qf.U3(theta, phi, lam, 1), [0])
     assert qf.gates_close(qf.CU3(theta, phi, lam, 0, 1), cgate)
 
+    # Definition in QASM (including the phase correction added by qiskit)
+    circ = qf.Circuit(
+        [
+            qf.PhaseShift((lam + phi) / 2, 0),
+            qf.PhaseShift((lam - phi) / 2, 1),
+            qf.CNot(0, 1),
+            qf.U3(-theta / 2, 0.0, -(phi + lam) / 2, 1),
+            qf.CNot(0, 1),
+            qf.U3(theta / 2, phi, 0.0, 1),
+        ]
+    )
+    assert np.allclose(
+        qf.CU3(theta, phi, lam, 0, 1).asoperator(), circ.asgate().asoperator()
+    )
+
 
 def test_CRZ() -> None:
     theta = 0.23
@@ -81,6 +96,7 @@ def test_RZZ() -> None:
     assert qf.gates_close(gate0, gate1)
     assert qf.gates_close(gate0.H, gate1.H)
     assert qf.gates_close(gate0 ** 0.12, gate1 ** 0.12)
+    assert np.allclose(gate0.asoperator(), gate1.asoperator())
 
 
 # fin
@@ -11,6 +11,7 @@ import numpy as np
 import pytest
 
 import quantumflow as qf
+from quantumflow.config import ATOL
 from quantumflow.visualization import kwarg_to_symbol
 
 
@@ -144,6 +145,24 @@ def test_tensor_properties(gatet: Type[qf.StdGate]) -> None:
         assert qf.gates_close(gate, perm_gate)
 
 
+def test_conjugate_pairs() -> None:
+    pairs = [
+        (qf.S(0), qf.S_H),
+        (qf.T(0), qf.T_H),
+        (qf.V(0), qf.V_H),
+        (qf.SqrtY(0), qf.SqrtY_H),
+        (qf.CV(0, 1), qf.CV_H),
+        (qf.SqrtISwap(0, 1), qf.SqrtISwap_H),
+        (qf.SqrtSwap(0, 1), qf.SqrtSwap_H),
+    ]
+    for gate, gatet in pairs:
+        inv_gate = gate.H
+        assert type(inv_gate) is gatet
+        assert type(inv_gate.H) is type(gate)
+        assert inv_gate.qubits == gate.qubits
+        assert qf.gates_close(inv_gate, qf.Unitary(gate.tensor, gate.qubits).H)
+
+
 @pytest.mark.parametrize("gatet", qf.STDGATES.values())
 def test_hamiltonians(gatet: Type[qf.StdGate]) -> None:
 
@@ -232,4 +251,95 @@ def test_StdCtrlGate_tensor_structure(gatetype: Type[qf.StdCtrlGate]) -> None:
     assert gatetype.cv_hermitian == gatetype.cv_target.cv_hermitian
 
 
+@pytest.mark.parametrize("gatetype", qf.STDCTRLGATES.values())
+def test_StdCtrlGate_tensor(gatetype: Type[qf.StdCtrlGate]) -> None:
+    gate = _randomize_gate(gatetype)
+    assert isinstance(gate, qf.StdCtrlGate)
+    ctrl_gate = qf.ControlGate(gate.target, gate.control_qubits)
+    assert qf.gates_close(gate, ctrl_gate)
+    assert np.allclose(gate.tensor, ctrl_gate.tensor, atol=ATOL)  # Including phase
+
+
+@pytest.mark.parametrize("gatetype", qf.STDCTRLGATES.values())
+def test_StdCtrlGate_run(gatetype: Type[qf.StdCtrlGate]) -> None:
+    gate = _randomize_gate(gatetype)
+    qubits = list(range(gate.qubit_nb + 2))
+    random.shuffle(qubits)
+    ket = qf.random_state(qubits)
+
+    tensor0 = gate.run(ket).tensor
+    tensor1 = qf.Unitary(gate.tensor, gate.qubits).run(ket).tensor
+    assert np.allclose(tensor0, tensor1)  # Including phase
+
+
+def test_shared_tensors() -> None:
+    for gatetype in qf.STDGATES.values():
+        gate0 = _randomize_gate(gatetype)
+        gate1 = gate0._with_params(*gate0.params)
+        assert gate0.tensor is gate1.tensor
+        assert not gate0.tensor.flags.writeable
+
+        # But operators are writable copies
+        op = gate0.asoperator()
+        op *= 2
+        assert np.allclose(2 * gate1.asoperator(), op)
+
+        # Decompositions should not modify the shared tensor
+        gate0.su()
+        assert np.allclose(gate0.tensor, gate1.tensor)
+
+    assert qf.Rx(0.1, 0).tensor is qf.Rx(0.1, 1).tensor
+    assert qf.Rx(0.1, 0).tensor is not qf.Rx(0.2, 0).tensor
+    assert qf.Rx(0.1, 0).tensor is not qf.Ry(0.1, 0).tensor
+    assert qf.CNot(0, 1).tensor is not qf.CZ(0, 1).tensor
+
+    # Fixed gates share tensors, but not instances, since operations are
+    # distinguished by identity (e.g. nodes of a DAGCircuit)
+    gate0, gate1 = qf.H(0), qf.H(0)
+    assert gate0 is not gate1
+    assert gate0.tensor is gate1.tensor
+    assert qf.DAGCircuit([gate0, gate1]).size() == 2
+
+
+@pytest.mark.parametrize("gatet", qf.STDGATES.values())
+def test_operator_batch(gatet: Type[qf.StdGate]) -> None:
+    shape = (3, 2) if gatet.cv_args else ()
+    params = [np.random.uniform(-4, 4, size=shape) for _ in gatet.cv_args]
+    ops = gatet.operator_batch(*params)
+
+    N = 2 ** gatet.cv_qubit_nb
+    assert ops.shape == shape + (N, N)
+
+    for idx in np.ndindex(shape):
+        gate = gatet(*(p[idx] for p in params), *range(gatet.cv_qubit_nb))
+        assert np.allclose(ops[idx], gate.asoperator())
+
+
+def test_operator_batch_vectorized() -> None:
+    # Gates with a vectorized operator_batch, rather than the generic fallback
+    vectorized = set()
+    for name, gatet in qf.STDGATES.items():
+        owner = next(cls for cls in gatet.__mro__ if "operator_batch" in vars(cls))
+        if owner is not qf.StdGate:
+            vectorized.add(name)
+
+    assert vectorized >= {
+        "Ph",
+        "PhaseShift",
+        "Rx",
+        "Ry",
+        "Rz",
+        "XPow",
+        "YPow",
+        "ZPow",
+        "CNotPow",
+        "CYPow",
+        "CZPow",
+        "CCXPow",
+        "CRx",
+        "CRy",
+        "CRz",
+    }
+
+
 # fin
@@ -5,6 +5,7 @@
 
 # DOCME
 
+import os
 import string
 from typing import TYPE_CHECKING, List, Sequence, Tuple
 
@@ -17,8 +18,30 @@ if TYPE_CHECKING:
 __all__ = ("QubitTensor", "asqutensor")
 
 
-qubit_dtype = np.complex128
-"""The complex data type used by the backend"""
+def _qubit_dtype(name: str) -> np.dtype:
+    """Return the named complex data type (e.g. from QF_DTYPE), which must be
+    either complex64 or complex128"""
+    try:
+        dtype = np.dtype(name)
+    except TypeError:
+        dtype = None
+    if dtype not in (np.complex64, np.complex128):
+        raise ValueError(
+            f"Unsupported QF_DTYPE '{name}': expected complex64 or complex128"
+        )
+    return dtype
+
+
+qubit_dtype = _qubit_dtype(os.environ.get("QF_DTYPE", "complex128"))
+"""The complex data type used by the backend.
+
+Defaults to complex128. Set the environment variable QF_DTYPE=complex64 (before
+importing quantumflow) to simulate in single precision, which halves the memory
+used by states and gates, at the cost of precision (~1e-7). The default
+tolerances (config.ATOL and config.RTOL) are loosened to match. Decompositions
+and Hamiltonians are always computed in double precision, but the precision of
+their results is still limited by that of the input gates.
+"""
 
 QubitTensor = np.ndarray
 """Type hint for numpy arrays representing quantum data.
@@ -31,7 +54,7 @@ def asqutensor(array: "ArrayLike") -> QubitTensor:
     """
     tensor = np.asarray(array, dtype=qubit_dtype)
 
-    N = int(np.log2(np.size(tensor)))
+    N = tensor.size.bit_length() - 1
     shape = (2,) * N
 
     if tensor.shape != shape:  # Only reshape if necessary
@@ -177,52 +200,60 @@ def partial_trace(
 def tensormul(
     tensor0: QubitTensor, tensor1: QubitTensor, indices: Tuple[int, ...]
 ) -> QubitTensor:
-    N = np.ndim(tensor1)
-    K = np.ndim(tensor0) // 2
+    # Note: Uses ndarray methods rather than numpy functions, since the dispatch
+    # overhead of the latter dominates for small states.
+    N = tensor1.ndim
+    K = tensor0.ndim // 2
     assert K == len(indices)
 
-    gate = np.reshape(tensor0, [2 ** K, 2 ** K])
+    gate = tensor0.reshape(2 ** K, 2 ** K)
+
+    if K == 1 and N - indices[0] > 4:
+        # View the tensor as a stack of (2, 2 ** (N-idx-1)) blocks, and multiply each
+        # block by the gate. Avoids transposing the tensor, but only pays off when
+        # the blocks are large enough.
+        (idx,) = indices
+        blocks = tensor1.reshape(2 ** idx, 2, 2 ** (N - idx - 1))
+        return np.matmul(gate, blocks).reshape(tensor1.shape)
 
     perm = list(indices) + [n for n in range(N) if n not in indices]
-    inv_perm = np.argsort(perm)
+    inv_perm = [0] * N
+    for n, p in enumerate(perm):
+        inv_perm[p] = n
 
     tensor = tensor1
-    tensor = np.transpose(tensor, perm)
-    tensor = np.reshape(tensor, [2 ** K, 2 ** (N - K)])
+    tensor = tensor.transpose(perm)
+    tensor = tensor.reshape(2 ** K, 2 ** (N - K))
 
     tensor = np.matmul(gate, tensor)
 
-    tensor = np.reshape(tensor, [2] * N)
-    tensor = np.transpose(tensor, inv_perm)
+    tensor = tensor.reshape((2,) * N)
+    tensor = tensor.transpose(inv_perm)
 
     return tensor
 
 
-# DOCME
 def tensormul_diagonal(
     tensor0_diagonal: QubitTensor,
     tensor1: QubitTensor,
     indices: Tuple[int, ...],
 ) -> QubitTensor:
+    """Multiply a tensor by a diagonal operator acting on the given indices.
+
+    The diagonal is broadcast across the remaining indices, so the state tensor
+    is neither transposed nor copied into a matrix.
+    """
     N = np.ndim(tensor1)
     K = np.ndim(tensor0_diagonal)
     assert K == len(indices)
 
-    perm = list(indices) + [n for n in range(N) if n not in indices]
-    inv_perm = np.argsort(perm)
-
-    tensor = tensor1
-    tensor = np.transpose(tensor, perm)
-    tensor = np.reshape(tensor, [2 ** K, 2 ** (N - K)])
-
-    tensor = np.transpose(tensor)
-    tensor = tensor * tensor0_diagonal.flatten()
-    tensor = np.transpose(tensor)
-
-    tensor = np.reshape(tensor, [2] * N)
-    tensor = np.transpose(tensor, inv_perm)
+    # Reorder the diagonal's axes to match the order of the indices in tensor1
+    diagonal = np.transpose(tensor0_diagonal, np.argsort(indices))
+    shape = [1] * N
+    for idx in indices:
+        shape[idx] = 2
 
-    return tensor
+    return tensor1 * np.reshape(diagonal, shape)
 
 
 # fin
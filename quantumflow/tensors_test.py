@@ -4,7 +4,10 @@
 # the LICENSE.txt file in the root directory of this source tree.
 
 
+import os
 import random
+import subprocess
+import sys
 
 import numpy as np
 import pytest
@@ -22,6 +25,65 @@ def test_asqutensor() -> None:
     assert tensor.shape == (2,) * 8
 
 
+def test_qubit_dtype() -> None:
+    dtype = np.dtype(os.environ.get("QF_DTYPE", "complex128"))
+    assert tensors.qubit_dtype == dtype
+    assert qf.zero_state(2).tensor.dtype == dtype
+
+
+_COMPLEX64_SCRIPT = """
+import numpy as np
+import quantumflow as qf
+
+assert qf.tensors.qubit_dtype == np.complex64
+
+circ = qf.Circuit([qf.H(0), qf.Rx(0.2, 1), qf.CNot(0, 1), qf.Y(1), qf.Rz(0.3, 0)])
+ket = circ.run(qf.zero_state(2))
+gate = circ.asgate()
+assert ket.tensor.dtype == np.complex64
+assert gate.tensor.dtype == np.complex64
+assert qf.states_close(ket, gate.run(qf.zero_state(2)))
+assert qf.almost_unitary(gate)
+
+fsim = qf.FSim(0.1, 0.2, 0, 1)
+assert qf.gates_close(fsim, qf.UnitaryGate.from_hamiltonian(fsim.hamiltonian, [0, 1]))
+
+rand = qf.RandomGate([0, 1])
+assert qf.gates_close(rand, qf.canonical_decomposition(rand).asgate())
+
+rand = qf.RandomGate([0, 1, 2])
+assert qf.gates_close(rand, qf.quantum_shannon_decomposition(rand).asgate())
+
+print(*np.real(ket.tensor.flatten()), *np.imag(ket.tensor.flatten()))
+"""
+
+
+def test_qubit_dtype_complex64() -> None:
+    # Run in a fresh interpreter, since QF_DTYPE is read when quantumflow is imported
+    env = dict(os.environ, QF_DTYPE="complex64")
+    out = subprocess.run(
+        [sys.executable, "-c", _COMPLEX64_SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    circ = qf.Circuit([qf.H(0), qf.Rx(0.2, 1), qf.CNot(0, 1), qf.Y(1), qf.Rz(0.3, 0)])
+    ket = circ.run(qf.zero_state(2))
+    amps = np.asarray(out.splitlines()[-1].split(), dtype=float)
+    assert np.allclose(amps[:4] + 1j * amps[4:], ket.tensor.flatten(), atol=1e-6)
+
+
+def test_qubit_dtype_invalid() -> None:
+    assert tensors._qubit_dtype("complex64") == np.complex64
+    assert tensors._qubit_dtype("complex128") == np.complex128
+
+    for name in ["float64", "complex256", "not_a_dtype"]:
+        with pytest.raises(ValueError):
+            tensors._qubit_dtype(name)
+
+
 def test_asqutensor_flatten() -> None:
     arr = np.zeros(shape=(256,))
     tensor = qf.asqutensor(arr)
@@ -68,4 +130,29 @@ def test_inner_product() -> None:
         tensors.inner(qf.CNot(0, 1).tensor, qf.X(0).tensor)
 
 
+def test_tensormul_1q() -> None:
+    N = 7
+    ket = qf.random_state(range(N))
+    gate = qf.RandomGate([0])
+    for idx in range(N):
+        tensor = tensors.tensormul(gate.tensor, ket.tensor, (idx,))
+
+        U = np.kron(np.eye(2 ** idx), gate.asoperator())
+        U = np.kron(U, np.eye(2 ** (N - idx - 1)))
+        vec = U @ ket.tensor.flatten()
+        assert np.allclose(tensor.flatten(), vec)
+
+
+def test_tensormul_diagonal() -> None:
+    for _ in range(REPS):
+        N = 5
+        ket = qf.random_state(range(N))
+        indices = tuple(random.sample(range(N), 3))
+        gate = qf.DiagonalGate(np.random.normal(size=8), indices)
+
+        tensor0 = tensors.tensormul_diagonal(gate.tensor_diagonal, ket.tensor, indices)
+        tensor1 = tensors.tensormul(gate.tensor, ket.tensor, indices)
+        assert np.allclose(tensor0, tensor1)
+
+
 # fin
@@ -10,13 +10,33 @@ QuantumFlow: Translate, transform, and compile circuits.
 
 # Note: Beta Prototype
 
-from typing import Callable, Generator, Set, Tuple
+from typing import Callable, Dict, Generator, List, Set, Tuple, Type
 
+from . import var
 from .circuits import Circuit
 from .dagcircuit import DAGCircuit
 from .info import almost_identity
-from .ops import Gate, Operation
-from .stdgates import CZ, ZZ, H, XPow, YPow, ZPow
+from .ops import Gate, Operation, Unitary
+from .qubits import Qubit
+from .stdgates import (
+    CCZ,
+    CZ,
+    S_H,
+    ZZ,
+    CCNot,
+    CNot,
+    CNotPow,
+    CZPow,
+    H,
+    S,
+    StdGate,
+    X,
+    XPow,
+    Y,
+    YPow,
+    Z,
+    ZPow,
+)
 from .translate import (
     circuit_translate,
     translate_ccnot_to_cnot,
@@ -74,6 +94,49 @@ def compile_circuit(circ: Circuit) -> Circuit:
     return circ
 
 
+def merge_1q_gates(circ: Circuit) -> Circuit:
+    """Merge each run of consecutive 1-qubit gates acting on the same qubit into
+    a single Unitary gate, so that a simulation makes one pass over the state per
+    run rather than one pass per gate.
+
+    Gates with symbolic parameters are not merged. A run consisting of a single
+    gate is left unchanged.
+    """
+    elements: List[Operation] = []
+    pending: Dict[Qubit, List[Gate]] = {}
+
+    def _flush(qubit: Qubit) -> None:
+        run = pending.pop(qubit, None)
+        if not run:
+            return
+        if len(run) == 1:
+            elements.append(run[0])
+            return
+        matrix = run[0].asoperator()
+        for gate in run[1:]:
+            matrix = gate.asoperator() @ matrix
+        elements.append(Unitary(matrix, [qubit]))
+
+    for elem in circ:
+        if (
+            isinstance(elem, Gate)
+            and elem.qubit_nb == 1
+            and not any(var.is_symbolic(p) for p in elem.params)
+        ):
+            (qubit,) = elem.qubits
+            pending.setdefault(qubit, []).append(elem)
+            continue
+
+        for qubit in elem.qubits:
+            _flush(qubit)
+        elements.append(elem)
+
+    for qubit in list(pending):
+        _flush(qubit)
+
+    return Circuit(elements)
+
+
 def find_pattern(
     dagc: DAGCircuit,
     gateset1: Set,
@@ -191,4 +254,63 @@ def convert_HZH(dagc: DAGCircuit) -> None:
         dagc.graph.add_edge(gate, nxt, key=q0)
 
 
+_CONJUGATIONS: Dict[Tuple[Type[Operation], Type[Operation]], Type[StdGate]] = {
+    (H, X): Z,
+    (H, Z): X,
+    (H, XPow): ZPow,
+    (H, ZPow): XPow,
+    (S_H, X): Y,
+    (S, Y): X,
+    (H, CNot): CZ,
+    (H, CZ): CNot,
+    (H, CNotPow): CZPow,
+    (H, CZPow): CNotPow,
+    (H, CCNot): CCZ,
+    (H, CCZ): CCNot,
+}
+"""Map from the types of a 1-qubit gate A and a gate G to the type of the gate
+equivalent to the sequence A, G, A^-1 (with A acting on the target qubit of G)"""
+
+
+def convert_conjugations(dagc: DAGCircuit) -> None:
+    """Replace a gate sandwiched between a 1-qubit gate and its inverse with a single
+    equivalent gate. e.g. H-Z-H becomes X, and H-CZ-H (with the Hadamards on
+    either qubit) becomes a CNot.
+    """
+    conj_types = {conj for conj, _ in _CONJUGATIONS}
+    gate_types = {gate for _, gate in _CONJUGATIONS}
+
+    G = dagc.graph
+    for elem1, elem2 in list(find_pattern(dagc, conj_types, gate_types)):
+        if elem1 not in G or elem2 not in G:
+            continue  # Already replaced
+        gatetype = _CONJUGATIONS.get((type(elem1), type(elem2)))
+        if gatetype is None:
+            continue
+
+        (q0,) = elem1.qubits
+        elem3 = dagc.next_element(elem2, q0)
+        if type(elem3) is not type(elem1.H):
+            continue
+
+        # The target qubit of a controlled gate comes last
+        qubits = [q for q in elem2.qubits if q != q0] + [q0]
+        if qubits != list(elem2.qubits) and not elem2.cv_interchangeable:
+            continue
+        gate = gatetype._from_params(elem2.params, qubits)
+
+        for q in elem2.qubits:
+            prv = dagc.prev_element(elem2, q)
+            nxt = dagc.next_element(elem2, q)
+            if q == q0:
+                prv = dagc.prev_element(elem1)
+                nxt = dagc.next_element(elem3)
+            G.add_edge(prv, gate, key=q)
+            G.add_edge(gate, nxt, key=q)
+
+        G.remove_node(elem1)
+        G.remove_node(elem2)
+        G.remove_node(elem3)
+
+
 # fin
@@ -3,6 +3,8 @@
 # This source code is licensed under the Apache License, Version 2.0 found in
 # the LICENSE.txt file in the root directory of this source tree.
 
+import numpy as np
+
 import quantumflow as qf
 
 
@@ -40,4 +42,78 @@ def test_merge() -> None:
     assert len(circ1) == 3
 
 
+def test_merge_1q_gates() -> None:
+    circ0 = qf.Circuit(
+        [
+            qf.X(0),
+            qf.X(1),
+            qf.H(2),
+            qf.Rx(0.2, 2),
+            qf.CCZ(0, 1, 2),
+            qf.H(2),
+            qf.T(0),
+            qf.S(0),
+            qf.Rz(qf.var.Symbol("theta"), 1),
+        ]
+    )
+    circ1 = qf.merge_1q_gates(circ0)
+    assert [type(elem) for elem in circ1] == [
+        qf.X,
+        qf.X,
+        qf.Unitary,
+        qf.CCZ,
+        qf.Rz,
+        qf.H,
+        qf.Unitary,
+    ]
+    circ0 = circ0.resolve({"theta": 0.3})
+    circ1 = qf.merge_1q_gates(circ0)
+    assert len(circ1) == 7
+    assert qf.circuits_close(circ0, circ1)
+
+    circ2 = qf.Circuit(qf.RandomGate([q]) for q in np.random.randint(0, 4, 20))
+    circ3 = qf.merge_1q_gates(circ2)
+    assert len(circ3) <= 4
+    assert qf.circuits_close(circ2, circ3)
+
+
+def test_convert_conjugations() -> None:
+    circ0 = qf.Circuit(
+        [
+            qf.X(0),
+            qf.X(1),
+            qf.H(2),
+            qf.CCZ(0, 1, 2),
+            qf.H(2),
+            qf.H(0),
+            qf.CZ(0, 1),
+            qf.H(0),
+            qf.S_H(1),
+            qf.X(1),
+            qf.S(1),
+            qf.H(2),
+            qf.XPow(0.3, 2),
+            qf.H(2),
+            qf.H(1),
+            qf.CNot(0, 1),
+            qf.H(0),
+        ]
+    )
+    dagc = qf.DAGCircuit(circ0)
+    qf.convert_conjugations(dagc)
+    circ1 = qf.Circuit(dagc)
+
+    assert qf.count_operations(circ1) == {
+        qf.X: 2,
+        qf.CCNot: 1,
+        qf.Y: 1,
+        qf.ZPow: 1,
+        qf.H: 2,
+        qf.CNot: 2,
+    }
+    assert qf.gates_close(circ0.asgate(), circ1.asgate())
+    # CZ(0, 1) with Hadamards on qubit 0 becomes CNot(1, 0)
+    assert (1, 0) in [elem.qubits for elem in circ1 if isinstance(elem, qf.CNot)]
+
+
 # fin
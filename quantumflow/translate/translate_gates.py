@@ -4,7 +4,8 @@
 # the LICENSE.txt file in the root directory of this source tree.
 
 
-from typing import Iterator, Union
+from functools import lru_cache
+from typing import Any, Iterator, Optional, Tuple, Union
 
 import networkx as nx
 import numpy as np
@@ -24,6 +25,7 @@ from ..gates import (
     ReversalGate,
 )
 from ..paulialgebra import pauli_commuting_sets
+from ..qubits import Qubit, Qubits
 from ..stdgates import (
     CZ,
     V_H,
@@ -104,7 +106,8 @@ def translate_PauliGate(
     the Pauli algebra element object, i.e. exp[-1.0j * alpha * element]
 
     If a qubit topology is provided then the returned circuit will
-    respect the qubit connectivity, adding swaps as necessary.
+    respect the qubit connectivity, adding swaps as necessary. Paths through
+    the topology are chosen using only the 'weight' attribute of the edges.
     """
     # Kudos: Adapted from pyquil. The topological network is novel.
 
@@ -120,6 +123,9 @@ def translate_PauliGate(
     if len(groups) != 1:
         raise ValueError("Pauli terms do not all commute")
 
+    # Snapshot the topology once, rather than once per term
+    snapshot = None if topology is None else _topology_snapshot(_topology_key(topology))
+
     for qbs, ops, coeff in element:
         if not np.isclose(complex(coeff).imag, 0.0):
             raise ValueError("Pauli term coefficients must be real")
@@ -130,40 +136,11 @@ def translate_PauliGate(
 
         # TODO: 1-qubit terms special case
 
-        active_qubits = set()
-        change_to_z_basis = Circuit()
-        for qubit, op in zip(qbs, ops):
-            active_qubits.add(qubit)
-            if op == "X":
-                change_to_z_basis += Y(qubit) ** -0.5
-            elif op == "Y":
-                change_to_z_basis += X(qubit) ** 0.5
-
-        if topology is not None:
-            if not nx.is_directed(topology) or not nx.is_arborescence(topology):
-                # An 'arborescence' is a directed tree
-                active_topology = steiner_tree(topology, active_qubits)
-                center = nx.center(active_topology)[0]
-                active_topology = nx.dfs_tree(active_topology, center)
-            else:
-                active_topology = topology
-        else:
-            active_topology = nx.DiGraph()
-            nx.add_path(active_topology, reversed(list(active_qubits)))
-
-        cnot_seq = Circuit()
-        order = list(reversed(list(nx.topological_sort(active_topology))))
-        for q0 in order[:-1]:
-            q1 = list(active_topology.pred[q0])[0]
-            if q1 not in active_qubits:
-                cnot_seq += Swap(q0, q1)
-                active_qubits.add(q1)
-            else:
-                cnot_seq += CNot(q0, q1)
+        change_to_z_basis, cnot_seq, target = _pauli_term_circuits(qbs, ops, snapshot)
 
         circ += change_to_z_basis
         circ += cnot_seq
-        circ += Z(order[-1]) ** (2 * theta / np.pi)
+        circ += Z(target) ** (2 * theta / np.pi)
         circ += cnot_seq.H
         circ += change_to_z_basis.H
     # end term loop
@@ -171,6 +148,82 @@ def translate_PauliGate(
     yield from circ  # type: ignore
 
 
+# Hashable summary of a topology graph: Is it directed, its nodes, and its
+# edges with their weights. (Other node and edge data are not used.)
+_TopologyKey = Tuple[bool, Tuple[Qubit, ...], Tuple[Tuple[Qubit, Qubit, Any], ...]]
+
+
+def _topology_key(topology: nx.Graph) -> _TopologyKey:
+    return (
+        nx.is_directed(topology),
+        tuple(topology.nodes),
+        tuple(topology.edges(data="weight")),
+    )
+
+
+@lru_cache(maxsize=32)
+def _topology_snapshot(topology_key: _TopologyKey) -> nx.Graph:
+    """Return a frozen copy of a topology graph, given its contents.
+
+    Equal topologies share the same snapshot, which is hashed by identity, so
+    that caching circuits for each Pauli term of a gate doesn't rehash the
+    whole graph for every term. Later changes to the caller's graph can't give
+    stale results, since those change the key.
+    """
+    directed, nodes, edges = topology_key
+    topology = nx.DiGraph() if directed else nx.Graph()
+    topology.add_nodes_from(nodes)
+    for q0, q1, weight in edges:
+        if weight is None:
+            topology.add_edge(q0, q1)
+        else:
+            topology.add_edge(q0, q1, weight=weight)
+    return nx.freeze(topology)
+
+
+@lru_cache(maxsize=512)
+def _pauli_term_circuits(
+    qbs: Qubits, ops: str, topology: Optional[nx.Graph]
+) -> Tuple[Circuit, Circuit, Qubit]:
+    """Return the change of basis and CNot sequence circuits, and the target qubit
+    of the final Z rotation, needed to exponentiate a single Pauli term.
+
+    Cached, since the same terms are typically exponentiated repeatedly (e.g. in
+    Trotter steps). The topology must be a snapshot from _topology_snapshot.
+    """
+    active_qubits = set(qbs)
+    change_to_z_basis = Circuit()
+    for qubit, op in zip(qbs, ops):
+        if op == "X":
+            change_to_z_basis += Y(qubit) ** -0.5
+        elif op == "Y":
+            change_to_z_basis += X(qubit) ** 0.5
+
+    if topology is not None:
+        if not nx.is_directed(topology) or not nx.is_arborescence(topology):
+            # An 'arborescence' is a directed tree
+            active_topology = steiner_tree(topology, active_qubits)
+            center = nx.center(active_topology)[0]
+            active_topology = nx.dfs_tree(active_topology, center)
+        else:
+            active_topology = topology
+    else:
+        active_topology = nx.DiGraph()
+        nx.add_path(active_topology, reversed(list(active_qubits)))
+
+    cnot_seq = Circuit()
+    order = list(reversed(list(nx.topological_sort(active_topology))))
+    for q0 in order[:-1]:
+        q1 = next(iter(active_topology.pred[q0]))
+        if q1 not in active_qubits:
+            cnot_seq += Swap(q0, q1)
+            active_qubits.add(q1)
+        else:
+            cnot_seq += CNot(q0, q1)
+
+    return change_to_z_basis, cnot_seq, order[-1]
+
+
 # end translate_PauliGate
 
 
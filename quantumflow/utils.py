@@ -310,7 +310,7 @@ def unitary_ensemble(dim: int) -> np.ndarray:
         Francesco Mezzadri, Notices Am. Math. Soc. 54, 592 (2007).
         arXiv:math-ph/0609050
     """
-    import scipy
+    import scipy.stats  # Imported here since scipy.stats is slow to import
 
     return scipy.stats.unitary_group.rvs(dim)
 